@@ -12,15 +12,20 @@ The application uses a terminal/hacker aesthetic with green text styling
 and command-line interface elements throughout.
 """
 
-from flask import Flask
+from flask import Flask, render_template, current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager
 from flask_wtf.csrf import CSRFProtect
 from flask_migrate import Migrate
 from flask_mail import Mail
+from flask_caching import Cache
+from jinja2 import FileSystemBytecodeCache
+from sqlalchemy import event
 from dotenv import load_dotenv
+from functools import lru_cache
+from datetime import datetime
 import os
-import markdown
+import threading
 
 # Load environment variables
 load_dotenv()
@@ -31,14 +36,93 @@ login_manager = LoginManager()
 csrf = CSRFProtect()
 migrate = Migrate()
 mail = Mail()
+cache = Cache()
+
+# Response compression is optional; responses are sent uncompressed without it
+try:
+    from flask_compress import Compress
+    compress = Compress()
+except ImportError:
+    compress = None
+
+_markdown_local = threading.local()
+
+def _get_markdown():
+    """Get this thread's Markdown converter, creating it on first use.
+
+    Building the extension chain is a large part of each conversion, so one
+    instance is kept per thread (Markdown objects aren't thread-safe) and
+    reset between documents. Markdown (and the Pygments lexers codehilite
+    pulls in) is imported here so workers that never render a post don't
+    pay for it at boot.
+    """
+    md = getattr(_markdown_local, 'md', None)
+    if md is None:
+        import markdown
+        md = _markdown_local.md = markdown.Markdown(extensions=['codehilite', 'fenced_code'])
+    return md
+
+@lru_cache(maxsize=512)
+def _render_markdown(text):
+    """Render Markdown to HTML, memoized on the raw source text.
+
+    Post content only changes when it is edited, so repeat renders of the
+    same post skip the Markdown/Pygments pass entirely.
+    """
+    return _get_markdown().reset().convert(text)
+
+@lru_cache(maxsize=32)
+def _compile_template_string(jinja_env, source):
+    """Compile a template source string once per Jinja environment."""
+    return jinja_env.from_string(source)
+
+def render_cached_template_string(source, **context):
+    """Render a template from a source string, like flask.render_template_string.
+
+    render_template_string re-parses and recompiles the source on every call;
+    this keeps the compiled template, so constant template strings (sitemap,
+    emails) are only compiled once per process.
+    """
+    app = current_app._get_current_object()
+    template = _compile_template_string(app.jinja_env, source)
+    app.update_template_context(context)
+    return template.render(context)
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for many small writes.
+
+    WAL lets readers carry on while a write commits, and with
+    synchronous=NORMAL a commit no longer waits on an fsync of the main
+    database file (still crash-safe in WAL mode).
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
 
 def create_app(config_name=None):
     """Create and configure the Flask application."""
     app = Flask(__name__)
     
-    # Load configuration
-    from app.config import Config
-    app.config.from_object(Config)
+    # Serialize JSON responses with orjson when available
+    from app.json_provider import OrjsonProvider, ORJSON_AVAILABLE
+    if ORJSON_AVAILABLE:
+        app.json = OrjsonProvider(app)
+    
+    # Load configuration (a named configuration such as 'testing' if given)
+    from app.config import Config, config
+    app.config.from_object(config[config_name] if config_name else Config)
+    
+    # Size the connection pool for server databases; SQLite keeps the defaults
+    # since it serializes writes anyway
+    if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+            **app.config['SQLALCHEMY_ENGINE_OPTIONS'],
+            'pool_size': app.config['DB_POOL_SIZE'],
+            'max_overflow': app.config['DB_MAX_OVERFLOW'],
+        }
     
     # Initialize extensions with app
     db.init_app(app)
@@ -46,6 +130,13 @@ def create_app(config_name=None):
     csrf.init_app(app)
     migrate.init_app(app, db)
     mail.init_app(app)
+    cache.init_app(app)
+    if compress is not None:
+        compress.init_app(app)
+    
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            event.listen(db.engine, 'connect', _set_sqlite_pragmas)
     
     # Configure login manager
     login_manager.login_view = 'auth.login'
@@ -54,8 +145,7 @@ def create_app(config_name=None):
     
     @login_manager.user_loader
     def load_user(user_id):
-        from app.models import User
-        return User.query.get(int(user_id))
+        return db.session.get(models.User, int(user_id))
     
     # Register blueprints
     from app.blueprints.main import bp as main_bp
@@ -70,33 +160,43 @@ def create_app(config_name=None):
     from app.blueprints.admin import bp as admin_bp
     app.register_blueprint(admin_bp, url_prefix='/admin')
     
-    # Create database tables
-    with app.app_context():
-        db.create_all()
+    # Write buffered post views in the background and at exit (tests flush explicitly)
+    if not app.testing:
+        models.start_view_flusher(app)
+    
+    # Create database tables on startup only when asked to; the schema is
+    # normally managed by migrate.py (and `flask init-db`)
+    if app.config.get('AUTO_CREATE_TABLES'):
+        with app.app_context():
+            db.create_all()
+    
+    # Persist compiled template bytecode so new workers and restarts skip
+    # recompiling every template on first render
+    jinja_cache_dir = os.path.join(app.instance_path, 'jinja_cache')
+    os.makedirs(jinja_cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(jinja_cache_dir)
     
     # Add markdown filter
     @app.template_filter('markdown')
     def markdown_filter(text):
-        return markdown.markdown(text, extensions=['codehilite', 'fenced_code'])
+        return _render_markdown(text)
     
     # Add template context processor for common variables
     @app.context_processor
     def inject_template_vars():
-        from datetime import datetime
+        now = datetime.now()
         return {
-            'current_year': datetime.now().year,
-            'now': datetime.now()
+            'current_year': now.year,
+            'now': now
         }
     
     # Error handlers
     @app.errorhandler(404)
     def not_found_error(error):
-        from flask import render_template
         return render_template('errors/404.html'), 404
     
     @app.errorhandler(500)
     def internal_error(error):
-        from flask import render_template
         db.session.rollback()
         return render_template('errors/500.html'), 500
     
@@ -2,20 +2,27 @@
 Admin blueprint routes for blog and portfolio management.
 """
 
-from flask import render_template, redirect, url_for, flash, request, abort
-from flask_login import login_required, current_user
+from flask import render_template, redirect, url_for, flash, request, abort, current_app
+from flask_login import current_user
+from flask_login.config import EXEMPT_METHODS
+from sqlalchemy import func, case, select
+from sqlalchemy.orm import selectinload
 from app.blueprints.admin import bp
-from app.models import BlogPost, PortfolioItem, Tag, ContactMessage, User
+from app.models import BlogPost, PortfolioItem, Tag, ContactMessage, User, post_tags, insert_ignore, make_slug
 from app.forms import BlogPostForm, PortfolioItemForm, TagForm, UserProfileForm
 from app.image_utils import save_portfolio_image, delete_portfolio_image
-from app import db
+from app.blueprints.blog.routes import clear_blog_cache
+from app.blueprints.main.routes import clear_page_cache, clear_dashboard_cache, DASHBOARD_STATS_CACHE_KEY
+from app import db, cache, login_manager
 from datetime import datetime
+from functools import wraps
 
 def admin_required(f):
     """Decorator function that ensures only admin users can access protected routes.
     
-    Checks that the current user is both authenticated and has admin privileges.
-    Raises 403 Forbidden error if access is denied.
+    Combines Flask-Login's login_required with the admin check in a single
+    wrapper: anonymous users are sent to the login page, and authenticated
+    users without admin privileges get a 403 Forbidden error.
     
     Args:
         f: The function to decorate
@@ -23,15 +30,75 @@ def admin_required(f):
     Returns:
         Decorated function with admin access control
     """
+    @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated or not current_user.is_admin:
-            abort(403)
+        if request.method not in EXEMPT_METHODS and not current_app.config.get('LOGIN_DISABLED'):
+            if not current_user.is_authenticated:
+                return login_manager.unauthorized()
+            if not current_user.is_admin:
+                abort(403)
         return f(*args, **kwargs)
-    decorated_function.__name__ = f.__name__
     return decorated_function
 
+def get_or_create_tags(tags_data):
+    """Resolve a comma-separated tag string into Tag objects.
+    
+    Existing tags are fetched with a single IN query; any missing names are
+    inserted in one statement that lets the database ignore duplicates, then
+    re-selected.
+    
+    Args:
+        tags_data (str): Comma-separated tag names from the post form
+        
+    Returns:
+        list: Tag objects in the order they were entered, without duplicates
+    """
+    if not tags_data:
+        return []
+    
+    names = list(dict.fromkeys(name.strip() for name in tags_data.split(',') if name.strip()))
+    existing = {tag.name: tag for tag in Tag.query.filter(Tag.name.in_(names)).all()}
+    
+    missing = [name for name in names if name not in existing]
+    if missing:
+        Tag.insert_missing(missing)
+        existing.update((tag.name, tag) for tag in Tag.query.filter(Tag.name.in_(missing)).all())
+    
+    # A name can still be absent if its slug collides with another tag's
+    return [existing[name] for name in names if name in existing]
+
+@cache.cached(timeout=60, key_prefix=DASHBOARD_STATS_CACHE_KEY)
+def get_dashboard_stats():
+    """Collect the dashboard counters, cached for a minute.
+    
+    Everything comes back in one round trip: total and published post
+    counts from a single conditional aggregate over blog_posts, and the
+    portfolio and unread message counts as scalar subqueries.
+    
+    Returns:
+        dict: Post, portfolio and unread message counts
+    """
+    post_counts = select(
+        func.count(BlogPost.id).label('total'),
+        func.coalesce(func.sum(case((BlogPost.is_published, 1), else_=0)), 0).label('published')
+    ).subquery()
+    
+    total_posts, published_posts, total_portfolio, unread_messages = db.session.query(
+        post_counts.c.total,
+        post_counts.c.published,
+        select(func.count(PortfolioItem.id)).scalar_subquery(),
+        select(func.count(ContactMessage.id)).where(ContactMessage.is_read.is_(False)).scalar_subquery()
+    ).one()
+    
+    return {
+        'total_posts': total_posts,
+        'published_posts': published_posts,
+        'draft_posts': total_posts - published_posts,
+        'total_portfolio': total_portfolio,
+        'unread_messages': unread_messages
+    }
+
 @bp.route('/dashboard')
-@login_required
 @admin_required
 def dashboard():
     """Admin dashboard displaying site statistics and recent activity.
@@ -46,41 +113,30 @@ def dashboard():
         Rendered admin dashboard template with statistics and activity data
     """
     # Get statistics
-    total_posts = BlogPost.query.count()
-    published_posts = BlogPost.query.filter_by(is_published=True).count()
-    draft_posts = total_posts - published_posts
-    total_portfolio = PortfolioItem.query.count()
-    unread_messages = ContactMessage.query.filter_by(is_read=False).count()
+    stats = get_dashboard_stats()
     
     # Recent activity
     recent_posts = BlogPost.query.order_by(BlogPost.created_at.desc()).limit(5).all()
     recent_messages = ContactMessage.query.order_by(ContactMessage.created_at.desc()).limit(5).all()
     
     return render_template('admin/dashboard.html',
-                         stats={
-                             'total_posts': total_posts,
-                             'published_posts': published_posts,
-                             'draft_posts': draft_posts,
-                             'total_portfolio': total_portfolio,
-                             'unread_messages': unread_messages
-                         },
+                         stats=stats,
                          recent_posts=recent_posts,
                          recent_messages=recent_messages)
 
 # Blog Post Management
 @bp.route('/posts')
-@login_required
 @admin_required
 def posts():
     """List all blog posts."""
     page = request.args.get('page', 1, type=int)
-    posts = BlogPost.query.order_by(BlogPost.created_at.desc()).paginate(
+    posts = BlogPost.query.options(selectinload(BlogPost.tags))\
+                          .order_by(BlogPost.created_at.desc()).paginate(
         page=page, per_page=10, error_out=False
     )
     return render_template('admin/posts.html', posts=posts)
 
 @bp.route('/posts/new', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def new_post():
     """Create a new blog post."""
@@ -104,32 +160,26 @@ def new_post():
         db.session.flush()  # Get the post ID
         
         # Handle tags
-        if form.tags.data:
-            tag_names = [name.strip() for name in form.tags.data.split(',')]
-            for tag_name in tag_names:
-                if tag_name:
-                    tag = Tag.query.filter_by(name=tag_name).first()
-                    if not tag:
-                        tag = Tag(name=tag_name)
-                        db.session.add(tag)
-                    post.tags.append(tag)
+        post.tags = get_or_create_tags(form.tags.data)
         
         db.session.commit()
+        clear_blog_cache()
+        clear_page_cache()
+        clear_dashboard_cache()
         flash('Blog post created successfully!', 'success')
         return redirect(url_for('admin.posts'))
     
     return render_template('admin/edit_post.html', form=form, post=None)
 
 @bp.route('/posts/edit/<int:id>', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def edit_post(id):
     """Edit an existing blog post."""
     post = BlogPost.query.get_or_404(id)
     form = BlogPostForm(obj=post)
     
-    # Pre-populate tags
-    if post.tags:
+    # Pre-populate tags (only on GET so submitted tags aren't overwritten)
+    if request.method == 'GET' and post.tags:
         form.tags.data = ', '.join([tag.name for tag in post.tags])
     
     if form.validate_on_submit():
@@ -146,37 +196,33 @@ def edit_post(id):
         elif not form.is_published.data and post.is_published:
             post.unpublish()
         
-        # Clear existing tags and add new ones
-        post.tags.clear()
-        if form.tags.data:
-            tag_names = [name.strip() for name in form.tags.data.split(',')]
-            for tag_name in tag_names:
-                if tag_name:
-                    tag = Tag.query.filter_by(name=tag_name).first()
-                    if not tag:
-                        tag = Tag(name=tag_name)
-                        db.session.add(tag)
-                    post.tags.append(tag)
+        # Replace existing tags with the submitted ones
+        post.tags = get_or_create_tags(form.tags.data)
         
         db.session.commit()
+        clear_blog_cache()
+        clear_page_cache()
+        clear_dashboard_cache()
         flash('Blog post updated successfully!', 'success')
         return redirect(url_for('admin.posts'))
     
     return render_template('admin/edit_post.html', form=form, post=post)
 
 @bp.route('/posts/delete/<int:id>')
-@login_required
 @admin_required
 def delete_post(id):
     """Delete a blog post."""
-    post = BlogPost.query.get_or_404(id)
-    db.session.delete(post)
+    db.session.execute(post_tags.delete().where(post_tags.c.post_id == id))
+    if not BlogPost.query.filter_by(id=id).delete(synchronize_session=False):
+        abort(404)
     db.session.commit()
+    clear_blog_cache()
+    clear_page_cache()
+    clear_dashboard_cache()
     flash('Blog post deleted successfully!', 'success')
     return redirect(url_for('admin.posts'))
 
 @bp.route('/posts/toggle-publish/<int:id>')
-@login_required
 @admin_required
 def toggle_publish(id):
     """Toggle the publication status of a blog post between published and draft.
@@ -187,29 +233,39 @@ def toggle_publish(id):
     Returns:
         Redirect to admin posts list with status update message
     """
-    post = BlogPost.query.get_or_404(id)
+    is_published = db.session.query(BlogPost.is_published).filter_by(id=id).scalar()
+    if is_published is None:
+        abort(404)
     
-    if post.is_published:
-        post.unpublish()
+    # Mirror BlogPost.publish()/unpublish() without loading the whole post
+    BlogPost.query.filter_by(id=id).update({
+        'is_published': not is_published,
+        'published_at': None if is_published else datetime.utcnow()
+    }, synchronize_session=False)
+    db.session.commit()
+    clear_blog_cache()
+    clear_page_cache()
+    clear_dashboard_cache()
+    
+    if is_published:
         flash('Post unpublished.', 'info')
     else:
-        post.publish()
         flash('Post published.', 'success')
     
-    db.session.commit()
     return redirect(url_for('admin.posts'))
 
 # Portfolio Management
 @bp.route('/portfolio')
-@login_required
 @admin_required
 def portfolio():
     """Manage portfolio items."""
-    items = PortfolioItem.query.order_by(PortfolioItem.sort_order).all()
+    page = request.args.get('page', 1, type=int)
+    items = PortfolioItem.query.order_by(PortfolioItem.sort_order).paginate(
+        page=page, per_page=25, error_out=False
+    )
     return render_template('admin/portfolio.html', items=items)
 
 @bp.route('/portfolio/new', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def new_portfolio_item():
     """Create a new portfolio item."""
@@ -245,13 +301,14 @@ def new_portfolio_item():
         
         db.session.add(item)
         db.session.commit()
+        clear_page_cache()
+        clear_dashboard_cache()
         flash('Portfolio item created successfully!', 'success')
         return redirect(url_for('admin.portfolio'))
     
     return render_template('admin/edit_portfolio.html', form=form, item=None)
 
 @bp.route('/portfolio/edit/<int:id>', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def edit_portfolio_item(id):
     """Edit a portfolio item."""
@@ -299,59 +356,85 @@ def edit_portfolio_item(id):
         item.updated_at = datetime.utcnow()
         
         db.session.commit()
+        clear_page_cache()
+        clear_dashboard_cache()
         flash('Portfolio item updated successfully!', 'success')
         return redirect(url_for('admin.portfolio'))
     
     return render_template('admin/edit_portfolio.html', form=form, item=item)
 
 @bp.route('/portfolio/delete/<int:id>')
-@login_required
 @admin_required
 def delete_portfolio_item(id):
     """Delete a portfolio item."""
-    item = PortfolioItem.query.get_or_404(id)
+    item = db.session.query(PortfolioItem.image_filename).filter_by(id=id).first()
+    if item is None:
+        abort(404)
     
     # Delete associated image file if it exists
     if item.image_filename:
         delete_portfolio_image(item.image_filename)
     
-    db.session.delete(item)
+    PortfolioItem.query.filter_by(id=id).delete(synchronize_session=False)
     db.session.commit()
+    clear_page_cache()
+    clear_dashboard_cache()
     flash('Portfolio item deleted successfully!', 'success')
     return redirect(url_for('admin.portfolio'))
 
 # Tags Management
 @bp.route('/tags')
-@login_required
 @admin_required
 def tags():
     """Manage blog tags."""
-    tags = Tag.query.all()
-    return render_template('admin/tags.html', tags=tags)
+    page = request.args.get('page', 1, type=int)
+    tags = Tag.query.order_by(Tag.name).paginate(
+        page=page, per_page=50, error_out=False
+    )
+    
+    # Post counts for the tags on this page in one grouped query
+    post_counts = dict(
+        db.session.query(post_tags.c.tag_id, func.count(post_tags.c.post_id))
+                  .filter(post_tags.c.tag_id.in_([tag.id for tag in tags.items]))
+                  .group_by(post_tags.c.tag_id)
+                  .all()
+    )
+    return render_template('admin/tags.html', tags=tags, post_counts=post_counts)
 
 @bp.route('/tags/new', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def new_tag():
     """Create a new tag."""
     form = TagForm()
     
     if form.validate_on_submit():
-        tag = Tag(
+        slug = make_slug(form.name.data)
+        result = db.session.execute(insert_ignore(Tag).values(
             name=form.name.data,
+            slug=slug,
             description=form.description.data,
             color=form.color.data or '#00ff00'
-        )
+        ))
+        
+        if not result.rowcount:
+            # Either the name or the slug is taken; names like "C++" and "C"
+            # differ but share a slug, so report whichever actually collided
+            if db.session.scalar(select(Tag.id).filter_by(name=form.name.data)):
+                flash('A tag with that name already exists.', 'error')
+            else:
+                existing = db.session.scalar(select(Tag.name).filter_by(slug=slug))
+                flash(f'The tag "{existing}" already uses the URL slug "{slug}". '
+                      'Please choose a more distinct name.', 'error')
+            return render_template('admin/edit_tag.html', form=form, tag=None)
         
-        db.session.add(tag)
         db.session.commit()
+        clear_blog_cache()
         flash('Tag created successfully!', 'success')
         return redirect(url_for('admin.tags'))
     
     return render_template('admin/edit_tag.html', form=form, tag=None)
 
 @bp.route('/tags/edit/<int:id>', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def edit_tag(id):
     """Edit a tag."""
@@ -364,25 +447,26 @@ def edit_tag(id):
         tag.color = form.color.data or '#00ff00'
         
         db.session.commit()
+        clear_blog_cache()
         flash('Tag updated successfully!', 'success')
         return redirect(url_for('admin.tags'))
     
     return render_template('admin/edit_tag.html', form=form, tag=tag)
 
 @bp.route('/tags/delete/<int:id>')
-@login_required
 @admin_required
 def delete_tag(id):
     """Delete a tag."""
-    tag = Tag.query.get_or_404(id)
-    db.session.delete(tag)
+    db.session.execute(post_tags.delete().where(post_tags.c.tag_id == id))
+    if not Tag.query.filter_by(id=id).delete(synchronize_session=False):
+        abort(404)
     db.session.commit()
+    clear_blog_cache()
     flash('Tag deleted successfully!', 'success')
     return redirect(url_for('admin.tags'))
 
 # Messages Management
 @bp.route('/messages')
-@login_required
 @admin_required
 def messages():
     """View contact messages."""
@@ -393,28 +477,28 @@ def messages():
     return render_template('admin/messages.html', messages=messages)
 
 @bp.route('/messages/read/<int:id>')
-@login_required
 @admin_required
 def mark_message_read(id):
     """Mark a message as read."""
-    message = ContactMessage.query.get_or_404(id)
-    message.mark_as_read()
+    if not ContactMessage.query.filter_by(id=id).update({'is_read': True}, synchronize_session=False):
+        abort(404)
+    db.session.commit()
+    clear_dashboard_cache()
     return redirect(url_for('admin.messages'))
 
 @bp.route('/messages/delete/<int:id>')
-@login_required
 @admin_required
 def delete_message(id):
     """Delete a contact message."""
-    message = ContactMessage.query.get_or_404(id)
-    db.session.delete(message)
+    if not ContactMessage.query.filter_by(id=id).delete(synchronize_session=False):
+        abort(404)
     db.session.commit()
+    clear_dashboard_cache()
     flash('Message deleted successfully!', 'success')
     return redirect(url_for('admin.messages'))
 
 # User Profile Management
 @bp.route('/profile', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def profile():
     """User profile management - change username and password."""
@@ -4,10 +4,12 @@ Authentication blueprint routes.
 
 from flask import render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, current_user, login_required
+from werkzeug.security import check_password_hash
 from app.blueprints.auth import bp
 from app.models import User
 from app.forms import LoginForm
 from app import db
+from datetime import datetime
 
 @bp.route('/login', methods=['GET', 'POST'])
 def login():
@@ -27,11 +29,17 @@ def login():
     form = LoginForm()
     
     if form.validate_on_submit():
-        user = User.query.filter_by(username=form.username.data).first()
+        # Only fetch what's needed to verify credentials; failed attempts
+        # never hydrate a full User object
+        credentials = db.session.query(User.id, User.password_hash)\
+                                .filter_by(username=form.username.data).first()
         
-        if user and user.check_password(form.password.data):
-            login_user(user, remember=form.remember_me.data)
-            user.update_last_login()
+        if credentials and check_password_hash(credentials.password_hash, form.password.data):
+            User.query.filter_by(id=credentials.id).update(
+                {'last_login': datetime.utcnow()}, synchronize_session=False
+            )
+            db.session.commit()
+            login_user(db.session.get(User, credentials.id), remember=form.remember_me.data)
             
             flash('Access granted. Welcome to the system.', 'success')
             
@@ -4,10 +4,35 @@ Blog blueprint routes for the terminal blog system.
 
 from flask import render_template, request, redirect, url_for, flash, abort, jsonify
 from app.blueprints.blog import bp
-from app.models import BlogPost, Tag
+from app.models import BlogPost, Tag, post_tags
 from app.forms import SearchForm
-from app import db
-from sqlalchemy import or_
+from app import db, cache
+from sqlalchemy.orm import selectinload, lazyload
+
+# Cache keys for the read-only post listings served to the terminal and feed readers
+API_POSTS_CACHE_KEY = 'blog_api_posts'
+FEED_CACHE_KEY = 'blog_feed'
+
+def clear_blog_cache():
+    """Drop cached post listings and tag lookups after posts or tags change."""
+    cache.delete_many(API_POSTS_CACHE_KEY, FEED_CACHE_KEY)
+    cache.delete_memoized(get_sidebar_tags)
+    cache.delete_memoized(get_tag_id_by_slug)
+
+@cache.memoize(timeout=300)
+def get_sidebar_tags():
+    """Return (name, slug) rows for every tag, ordered by name, for the blog sidebar."""
+    return db.session.query(Tag.name, Tag.slug).order_by(Tag.name).all()
+
+@bp.context_processor
+def inject_blog_sidebar():
+    """Make the cached sidebar tag list available to blog templates."""
+    return {'sidebar_tags': get_sidebar_tags()}
+
+@cache.memoize(timeout=300)
+def get_tag_id_by_slug(slug):
+    """Return the id of the tag with the given slug, or None if it doesn't exist."""
+    return db.session.query(Tag.id).filter_by(slug=slug).scalar()
 
 @bp.route('/')
 def index():
@@ -19,38 +44,32 @@ def index():
     - q: Search query to filter posts by title/content
     
     Returns:
-        Rendered blog index template with posts, tags, and search form
+        Rendered blog index template with posts and search form
     """
     page = request.args.get('page', 1, type=int)
     tag_slug = request.args.get('tag')
-    search_query = request.args.get('q')
+    # Blank or whitespace-only searches are treated as no search
+    search_query = request.args.get('q', '').strip() or None
     
-    # Base query for published posts
-    query = BlogPost.query.filter_by(is_published=True)
+    # Base query for published posts, loading tags for the whole page in one query
+    query = BlogPost.query.options(selectinload(BlogPost.tags)).filter_by(is_published=True)
     
     # Filter by tag if provided
     if tag_slug:
-        tag = Tag.query.filter_by(slug=tag_slug).first_or_404()
-        query = query.filter(BlogPost.tags.contains(tag))
+        tag_id = get_tag_id_by_slug(tag_slug)
+        if tag_id is None:
+            abort(404)
+        query = query.filter(BlogPost.tags.any(Tag.id == tag_id))
     
     # Filter by search query if provided
     if search_query:
-        query = query.filter(
-            or_(
-                BlogPost.title.contains(search_query),
-                BlogPost.content.contains(search_query),
-                BlogPost.excerpt.contains(search_query)
-            )
-        )
+        query = query.filter(BlogPost.search_filter(search_query))
     
     # Order by publication date and paginate
     posts = query.order_by(BlogPost.published_at.desc()).paginate(
         page=page, per_page=5, error_out=False
     )
     
-    # Get all tags for sidebar
-    tags = Tag.query.all()
-    
     # Search form
     search_form = SearchForm()
     if search_query:
@@ -58,7 +77,6 @@ def index():
     
     return render_template('blog/index.html', 
                          posts=posts, 
-                         tags=tags, 
                          search_form=search_form,
                          current_tag=tag_slug,
                          search_query=search_query)
@@ -78,14 +96,15 @@ def post(slug):
     # Increment view count
     post.increment_views()
     
-    # Get related posts (same tags, excluding current post)
-    related_posts = []
-    if post.tags:
-        related_posts = BlogPost.query.filter(
-            BlogPost.tags.any(Tag.id.in_([tag.id for tag in post.tags])),
-            BlogPost.id != post.id,
-            BlogPost.is_published == True
-        ).limit(3).all()
+    # Get related posts (same tags, excluding current post) in one query;
+    # DISTINCT stops posts sharing several tags from filling the limit twice.
+    # Their tags aren't shown, so the default eager tag load is skipped
+    post_tag_ids = db.session.query(post_tags.c.tag_id).filter(post_tags.c.post_id == post.id)
+    related_posts = BlogPost.query.options(lazyload(BlogPost.tags)).join(BlogPost.tags).filter(
+        Tag.id.in_(post_tag_ids),
+        BlogPost.id != post.id,
+        BlogPost.is_published.is_(True)
+    ).distinct().limit(3).all()
     
     return render_template('blog/post.html', 
                          post=post, 
@@ -99,12 +118,13 @@ def tag(slug):
 @bp.route('/search')
 def search():
     """Search posts."""
-    query = request.args.get('q', '')
+    query = request.args.get('q', '').strip()
     if query:
         return redirect(url_for('blog.index', q=query))
     return redirect(url_for('blog.index'))
 
 @bp.route('/api/posts')
+@cache.cached(timeout=60, key_prefix=API_POSTS_CACHE_KEY)
 def api_posts():
     """API endpoint that returns recent published blog posts in JSON format.
     
@@ -122,16 +142,18 @@ def api_posts():
             'title': post.title,
             'slug': post.slug,
             'excerpt': post.excerpt,
-            'published_at': post.published_at.strftime('%Y-%m-%d') if post.published_at else None,
+            'published_at': post.published_at.date().isoformat() if post.published_at else None,
             'reading_time': post.reading_time,
             'view_count': post.view_count
         } for post in posts]
     })
 
 @bp.route('/feed')
+@cache.cached(timeout=60, key_prefix=FEED_CACHE_KEY)
 def feed():
     """RSS feed for blog posts."""
-    posts = BlogPost.query.filter_by(is_published=True)\
+    posts = BlogPost.query.options(selectinload(BlogPost.tags))\
+                          .filter_by(is_published=True)\
                           .order_by(BlogPost.published_at.desc())\
                           .limit(20).all()
     
@@ -2,7 +2,8 @@
 Main blueprint routes for the hacker terminal personal brand page.
 """
 
-from flask import render_template, request, flash, redirect, url_for, current_app, session
+from flask import render_template, request, flash, redirect, url_for, current_app, session, make_response
+from flask_login import current_user
 from app.blueprints.main import bp
 from app.models import BlogPost, PortfolioItem, ContactMessage
 from app.forms import ContactForm
@@ -12,131 +13,87 @@ try:
 except ImportError:
     RECAPTCHA_FORM_AVAILABLE = False
     ContactFormWithRecaptcha = None
-from app import db
-from app.github_stats import github_stats
-from app.email_utils import send_contact_form_email, send_contact_confirmation_email
+from app import db, cache
+from app.github_stats import get_github_stats
+from app.email_utils import send_contact_emails_async
+from sqlalchemy import select
+from sqlalchemy.orm import load_only, raiseload
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 
 # Import SEO routes to register them
 from app.blueprints.main import seo_routes
 
-@bp.route('/')
-@bp.route('/index')
-def index():
-    """Homepage with terminal interface."""
-    # Get latest blog posts
-    latest_posts = BlogPost.query.filter_by(is_published=True)\
-                                 .order_by(BlogPost.published_at.desc())\
-                                 .limit(3).all()
-    
-    # Get featured portfolio items
-    portfolio_items = PortfolioItem.query.filter_by(is_featured=True)\
-                                        .order_by(PortfolioItem.sort_order)\
-                                        .all()
-    
-    # If no featured items, get all items
-    if not portfolio_items:
-        portfolio_items = PortfolioItem.query.order_by(PortfolioItem.sort_order).all()
-    
- 
+PAGE_CACHE_VERSION_KEY = 'page_cache_version'
+GITHUB_STATS_CACHE_KEY = 'github_stats'
+GITHUB_ACTIVITY_CACHE_KEY = 'github_activity_30d'
+DASHBOARD_STATS_CACHE_KEY = 'admin_dashboard_stats'
+
+def skip_page_cache():
+    """Bypass the shared page cache for logged-in users, pending flash messages
+    and query-string variants, since those render per-visitor content.
+    """
+    return (current_user.is_authenticated or '_flashes' in session
+            or bool(request.query_string))
+
+def page_cache_key():
+    """Cache key for a rendered page.
     
-    return render_template('main/index.html', 
-                         latest_posts=latest_posts,
-                         portfolio_items=portfolio_items)
+    Includes the host (templates render request.url into canonical/OG tags) and
+    a version number that clear_page_cache() bumps to invalidate every page.
+    """
+    version = cache.get(PAGE_CACHE_VERSION_KEY) or 0
+    return f'page/{version}/{request.host}{request.path}'
 
-@bp.route('/portfolio')
-@bp.route('/portfolio/')
-def portfolio():
-    """Portfolio showcase page."""
-    items = PortfolioItem.query.order_by(PortfolioItem.sort_order).all()
-    return render_template('main/portfolio.html', portfolio_items=items)
+def clear_page_cache():
+    """Invalidate all cached pages, e.g. after blog posts or portfolio items change."""
+    version = cache.get(PAGE_CACHE_VERSION_KEY) or 0
+    cache.set(PAGE_CACHE_VERSION_KEY, version + 1, timeout=0)
 
-@bp.route('/about')
-@bp.route('/about/')
-def about():
-    """About page with personal information."""
-    return render_template('main/about.html')
+def clear_dashboard_cache():
+    """Drop the admin dashboard's cached counters after posts, portfolio items or messages change."""
+    cache.delete(DASHBOARD_STATS_CACHE_KEY)
 
-@bp.route('/contact', methods=['GET', 'POST'])
-@bp.route('/contact/', methods=['GET', 'POST'])
-def contact():
-    """Contact form page."""
-    # Check if contact form is enabled
-    contact_form_enabled = current_app.config.get('CONTACT_FORM_ENABLED', False)
-    
-    # If form is disabled, just render the page without form processing
-    if not contact_form_enabled:
-        return render_template('main/contact.html', form=None, contact_form_enabled=False)
-    
-    # Use reCAPTCHA form if available and configured
-    use_recaptcha = (RECAPTCHA_FORM_AVAILABLE and 
-                    current_app.config.get('RECAPTCHA_PUBLIC_KEY') and 
-                    current_app.config.get('RECAPTCHA_PRIVATE_KEY'))
-    
-    if use_recaptcha:
-        form = ContactFormWithRecaptcha()
-    else:
-        form = ContactForm()
+def cacheable_api(max_age):
+    """Decorator that lets clients cache an API response and revalidate it cheaply.
     
-    if form.validate_on_submit():
-        # Create new contact message
-        message = ContactMessage(
-            name=form.name.data,
-            email=form.email.data,
-            subject=form.subject.data,
-            message=form.message.data
-        )
-        
-        db.session.add(message)
-        
-        try:
-            # Send email notification
-            email_sent = send_contact_form_email(
-                name=form.name.data,
-                email=form.email.data,
-                subject=form.subject.data,
-                message=form.message.data
-            )
-            
-            # Send confirmation email to user
-            confirmation_sent = send_contact_confirmation_email(
-                name=form.name.data,
-                email=form.email.data
-            )
-            
-            db.session.commit()
-            
-            # Invalidate session to prevent reuse
-            session.clear()  # This forces bots to solve reCAPTCHA again
-            
-            if email_sent:
-                flash('Message sent successfully! I\'ll get back to you soon.', 'success')
-            else:
-                flash('Message saved but email notification failed. I\'ll still see your message and respond soon.', 'warning')
-                
-        except Exception as e:
-            db.session.rollback()
-            current_app.logger.error(f"Contact form error: {str(e)}")
-            flash('There was an error sending your message. Please try again or contact me directly.', 'error')
-            
-        return redirect(url_for('main.contact'))
+    Adds an ETag (a hash of the body) and a public Cache-Control max-age, and
+    answers with an empty 304 when the client's If-None-Match is still current.
     
-    return render_template('main/contact.html', form=form, contact_form_enabled=True)
-
-@bp.route('/terminal')
-@bp.route('/terminal/')
-def terminal():
-    """Interactive terminal interface."""
-    return render_template('main/terminal.html')
+    Args:
+        max_age (int): Seconds browsers and proxies may reuse the response
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            response = make_response(f(*args, **kwargs))
+            response.cache_control.public = True
+            response.cache_control.max_age = max_age
+            response.add_etag()
+            return response.make_conditional(request)
+        return decorated_function
+    return decorator
 
-# API endpoints for terminal commands
-@bp.route('/api/terminal/help')
-def terminal_help():
-    """API endpoint that returns a dictionary of available terminal commands and their descriptions.
+def with_stale_fallback(key, data, ok):
+    """Remember the last good GitHub response, and serve it when a fresh fetch fails.
     
+    Args:
+        key (str): Cache key of the endpoint
+        data (dict): Freshly fetched response data
+        ok (bool): Whether the fresh fetch succeeded
+        
     Returns:
-        dict: Dictionary with 'commands' key containing command descriptions
+        dict: The fresh data, or the last good response if the fetch failed
     """
-    commands = {
+    stale_key = f'stale_{key}'
+    if ok:
+        cache.set(stale_key, data, timeout=0)
+        return data
+    return cache.get(stale_key) or data
+
+# Static terminal responses, built once rather than on every request
+TERMINAL_HELP = {
+    'commands': {
         'help': 'Show this help message',
         'about': 'Display information about David',
         'portfolio': 'List my projects',
@@ -149,50 +106,31 @@ def terminal_help():
         'ls': 'List available sections',
         'cat <section>': 'Display content of a section'
     }
-    return {'commands': commands}
+}
 
-# API endpoints for GitHub stats
-@bp.route('/api/github/stats')
-def github_stats_api():
-    """API endpoint that fetches GitHub statistics including commit count and profile data.
-    
-    Returns:
-        dict: JSON response containing commits, profile stats, and username
-    """
-    commits = github_stats.get_commits_this_month()
-    profile = github_stats.get_profile_stats()
-    repos = github_stats.get_user_repos()
-    
-    # Add actual total repo count (includes private if authenticated)
-    profile['total_repos'] = len(repos) if repos else profile.get('public_repos', 0)
-    
-    return {
-        'commits': commits,
-        'profile': profile,
-        'username': github_stats.username
-    }
+# Static tail of the "command not found" output
+NOT_FOUND_TAIL = ('', 'Type "help" for available commands.')
 
-@bp.route('/api/github/activity')
-def github_activity_api():
-    """API endpoint that fetches recent GitHub activity for the past 30 days.
-    
-    Returns:
-        dict: JSON response containing recent commit activity data
+@lru_cache(maxsize=256)
+def command_not_found_json(json_provider, command):
+    """Serialize the "command not found" response, memoized so repeated unknown
+    commands (e.g. bots probing paths) skip rebuilding and re-encoding it.
+    Keyed on the app's JSON provider too, so each app gets its own encoding.
     """
-    activity = github_stats.get_recent_activity(days=30)
-    return {'activity': activity}
+    return json_provider.dumps({'output': (f'Command not found: {command}',) + NOT_FOUND_TAIL})
 
-@bp.route('/api/terminal/command/<command>')
-def terminal_command(command):
-    """API endpoint that processes terminal commands and returns appropriate responses.
+@bp.record_once
+def build_terminal_responses(state):
+    """Build and serialize the terminal command responses once the app's config is loaded.
+    
+    The pre-serialized JSON bodies are stored on the app (in
+    app.extensions['terminal_responses']), so each app serves responses built
+    from its own config and requests skip the encoder.
     
     Args:
-        command (str): The terminal command to process
-        
-    Returns:
-        dict: JSON response with command output
+        state (BlueprintSetupState): Registration state holding the app
     """
-    
+    config = state.app.config
     responses = {
         'about': {
             'output': [
@@ -233,9 +171,9 @@ def terminal_command(command):
                 'Contact Information:',
                 '',
                 '📧 Email: Available on request',
-                '🐙 GitHub: ' + current_app.config.get('GITHUB_URL', '#'),
-                '🐦 Twitter: ' + current_app.config.get('TWITTER_URL', '#'),
-                '💼 LinkedIn: ' + current_app.config.get('LINKEDIN_URL', '#'),
+                '🐙 GitHub: ' + config.get('GITHUB_URL', '#'),
+                '🐦 Twitter: ' + config.get('TWITTER_URL', '#'),
+                '💼 LinkedIn: ' + config.get('LINKEDIN_URL', '#'),
                 '',
                 'Or use the contact form at /contact'
             ]
@@ -244,9 +182,9 @@ def terminal_command(command):
             'output': [
                 'Social Media & Links:',
                 '',
-                '🐙 GitHub: ' + current_app.config.get('GITHUB_URL', '#'),
-                '🐦 Twitter: ' + current_app.config.get('TWITTER_URL', '#'),
-                '💼 LinkedIn: ' + current_app.config.get('LINKEDIN_URL', '#'),
+                '🐙 GitHub: ' + config.get('GITHUB_URL', '#'),
+                '🐦 Twitter: ' + config.get('TWITTER_URL', '#'),
+                '💼 LinkedIn: ' + config.get('LINKEDIN_URL', '#'),
                 '',
                 'Follow me for updates on my latest projects!'
             ]
@@ -292,13 +230,216 @@ def terminal_command(command):
         }
     }
     
+    state.app.extensions['terminal_responses'] = {
+        'help': state.app.json.dumps(TERMINAL_HELP),
+        'commands': {command: state.app.json.dumps(response) for command, response in responses.items()},
+    }
+
+def get_latest_posts():
+    """Return the three most recently published blog posts.
+    
+    Only the columns the homepage renders are loaded (content is only fetched
+    for a post with no excerpt), and relationships are set to raise instead of
+    silently lazy-loading one query per post.
+    """
+    stmt = select(BlogPost)\
+        .options(load_only(BlogPost.title, BlogPost.slug, BlogPost.excerpt, BlogPost.word_count,
+                           BlogPost.published_at, BlogPost.view_count),
+                 raiseload('*'))\
+        .where(BlogPost.is_published.is_(True))\
+        .order_by(BlogPost.published_at.desc())\
+        .limit(3)
+    return db.session.execute(stmt).scalars().all()
+
+def get_homepage_portfolio_items():
+    """Return the featured portfolio items, or all items if none are featured.
+    
+    Uses a single query (the portfolio table is small) and partitions in Python.
+    """
+    stmt = select(PortfolioItem)\
+        .options(raiseload('*'))\
+        .order_by(PortfolioItem.is_featured.desc(), PortfolioItem.sort_order)
+    items = db.session.execute(stmt).scalars().all()
+    return [item for item in items if item.is_featured] or items
+
+# Worker threads for running independent homepage queries concurrently
+_query_executor = ThreadPoolExecutor(max_workers=2)
+
+def _run_in_app_context(app, query):
+    """Run a query function in its own app context (and therefore its own session)."""
+    with app.app_context():
+        return query()
+
+@bp.route('/')
+@bp.route('/index')
+@cache.cached(timeout=300, key_prefix=page_cache_key, unless=skip_page_cache)
+def index():
+    """Homepage with terminal interface."""
+    if current_app.config.get('PARALLEL_HOMEPAGE_QUERIES'):
+        app = current_app._get_current_object()
+        futures = [_query_executor.submit(_run_in_app_context, app, query)
+                   for query in (get_latest_posts, get_homepage_portfolio_items)]
+        # Attach the loaded objects to this request's session without re-querying
+        latest_posts, portfolio_items = (
+            [db.session.merge(obj, load=False) for obj in future.result()]
+            for future in futures
+        )
+    else:
+        latest_posts = get_latest_posts()
+        portfolio_items = get_homepage_portfolio_items()
+    
+    return render_template('main/index.html', 
+                         latest_posts=latest_posts,
+                         portfolio_items=portfolio_items)
+
+@bp.route('/portfolio', strict_slashes=False)
+@cache.cached(timeout=300, key_prefix=page_cache_key, unless=skip_page_cache)
+def portfolio():
+    """Portfolio showcase page."""
+    stmt = select(PortfolioItem).options(raiseload('*')).order_by(PortfolioItem.sort_order)
+    items = db.session.execute(stmt).scalars().all()
+    return render_template('main/portfolio.html', portfolio_items=items)
+
+@bp.route('/about', strict_slashes=False)
+@cache.cached(timeout=300, key_prefix=page_cache_key, unless=skip_page_cache)
+def about():
+    """About page with personal information."""
+    return render_template('main/about.html')
+
+@bp.route('/contact', methods=['GET', 'POST'], strict_slashes=False)
+def contact():
+    """Contact form page."""
+    # Check if contact form is enabled
+    contact_form_enabled = current_app.config.get('CONTACT_FORM_ENABLED', False)
+    
+    # If form is disabled, just render the page without form processing
+    if not contact_form_enabled:
+        return render_template('main/contact.html', form=None, contact_form_enabled=False)
+    
+    # Use reCAPTCHA form if available and configured
+    use_recaptcha = (RECAPTCHA_FORM_AVAILABLE and 
+                    current_app.config.get('RECAPTCHA_PUBLIC_KEY') and 
+                    current_app.config.get('RECAPTCHA_PRIVATE_KEY'))
+    
+    if use_recaptcha:
+        form = ContactFormWithRecaptcha()
+    else:
+        form = ContactForm()
+    
+    if form.validate_on_submit():
+        # Create new contact message
+        message = ContactMessage(
+            name=form.name.data,
+            email=form.email.data,
+            subject=form.subject.data,
+            message=form.message.data
+        )
+        
+        db.session.add(message)
+        
+        # Save the message before touching email, so the transaction (and its
+        # pooled connection) isn't held open while mail is dispatched
+        try:
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            current_app.logger.error(f"Contact form error: {str(e)}")
+            flash('There was an error sending your message. Please try again or contact me directly.', 'error')
+            return redirect(url_for('main.contact'))
+        
+        # The new message is unread, so the dashboard's count is now stale
+        clear_dashboard_cache()
+        
+        # Invalidate session to prevent reuse
+        session.clear()  # This forces bots to solve reCAPTCHA again
+        
+        try:
+            # Send the notification and confirmation emails without blocking the response
+            send_contact_emails_async(
+                name=form.name.data,
+                email=form.email.data,
+                subject=form.subject.data,
+                message=form.message.data
+            )
+            flash('Message sent successfully! I\'ll get back to you soon.', 'success')
+        except Exception as e:
+            current_app.logger.error(f"Contact email dispatch error: {str(e)}")
+            flash('Message saved but email notification failed. I\'ll still see your message and respond soon.', 'warning')
+            
+        return redirect(url_for('main.contact'))
+    
+    return render_template('main/contact.html', form=form, contact_form_enabled=True)
+
+@bp.route('/terminal', strict_slashes=False)
+@cache.cached(timeout=300, key_prefix=page_cache_key, unless=skip_page_cache)
+def terminal():
+    """Interactive terminal interface."""
+    return render_template('main/terminal.html')
+
+# API endpoints for terminal commands
+@bp.route('/api/terminal/help')
+@cacheable_api(max_age=600)
+def terminal_help():
+    """API endpoint that returns a dictionary of available terminal commands and their descriptions.
+    
+    Returns:
+        Response: JSON object with 'commands' key containing command descriptions
+    """
+    help_json = current_app.extensions['terminal_responses']['help']
+    return current_app.response_class(help_json, mimetype='application/json')
+
+# API endpoints for GitHub stats
+@bp.route('/api/github/stats')
+@cacheable_api(max_age=300)
+@cache.cached(timeout=300, key_prefix=GITHUB_STATS_CACHE_KEY)
+def github_stats_api():
+    """API endpoint that fetches GitHub statistics including commit count and profile data.
+    
+    Returns:
+        dict: JSON response containing commits, profile stats, and username
+    """
+    github_stats = get_github_stats()
+    commits = github_stats.get_commits_this_month()
+    profile = github_stats.get_profile_stats()
+    # Served from the app cache after the first call, so counting is cheap
+    repos = github_stats.get_user_repos()
+    
+    # Add actual total repo count (includes private if authenticated)
+    profile['total_repos'] = len(repos) if repos else profile.get('public_repos', 0)
+    
+    data = {
+        'commits': commits,
+        'profile': profile,
+        'username': github_stats.username
+    }
+    return with_stale_fallback(GITHUB_STATS_CACHE_KEY, data, ok='error' not in commits and bool(profile))
+
+@bp.route('/api/github/activity')
+@cacheable_api(max_age=600)
+@cache.cached(timeout=600, key_prefix=GITHUB_ACTIVITY_CACHE_KEY)
+def github_activity_api():
+    """API endpoint that fetches recent GitHub activity for the past 30 days.
+    
+    Returns:
+        dict: JSON response containing recent commit activity data
+    """
+    activity = get_github_stats().get_recent_activity(days=30)
+    return with_stale_fallback(GITHUB_ACTIVITY_CACHE_KEY, {'activity': activity}, ok=bool(activity))
+
+@bp.route('/api/terminal/command/<command>')
+@cacheable_api(max_age=600)
+def terminal_command(command):
+    """API endpoint that processes terminal commands and returns appropriate responses.
+    
+    Args:
+        command (str): The terminal command to process
+        
+    Returns:
+        Response: JSON response with command output
+    """
+    responses = current_app.extensions['terminal_responses']['commands']
     if command in responses:
-        return responses[command]
+        return current_app.response_class(responses[command], mimetype='application/json')
     else:
-        return {
-            'output': [
-                f'Command not found: {command}',
-                '',
-                'Type "help" for available commands.'
-            ]
-        }
\ No newline at end of file
+        return current_app.response_class(command_not_found_json(current_app.json, command),
+                                          mimetype='application/json')
\ No newline at end of file
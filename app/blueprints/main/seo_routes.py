@@ -2,20 +2,47 @@
 SEO-related routes for robots.txt, sitemap.xml, and other SEO utilities.
 """
 
-from flask import current_app, render_template_string, url_for
+from flask import current_app, url_for, request, make_response
+from sqlalchemy import func
+from app import db
 from app.blueprints.main import bp
-from app.models import BlogPost, PortfolioItem
+from app.models import BlogPost
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+from xml.sax.saxutils import escape
 
+# (endpoint, changefreq, priority) of the static pages listed in the sitemap
+STATIC_PAGE_SPECS = (
+    ('main.index', 'weekly', '1.0'),
+    ('main.about', 'monthly', '0.8'),
+    ('main.portfolio', 'weekly', '0.9'),
+    ('main.contact', 'monthly', '0.7'),
+    ('main.terminal', 'monthly', '0.6'),
+    ('blog.index', 'daily', '0.9'),
+)
 
-@bp.route('/robots.txt')
-def robots_txt():
-    """Generate robots.txt file for search engine crawlers."""
-    robots_content = f"""User-agent: *
+# Sitemap XML is built with plain string formatting; the schema is fixed
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+SITEMAP_URL_FORMAT = (
+    '    <url>\n'
+    '        <loc>{url}</loc>\n'
+    '        <lastmod>{lastmod}</lastmod>\n'
+    '        <changefreq>{changefreq}</changefreq>\n'
+    '        <priority>{priority}</priority>\n'
+    '    </url>\n'
+)
+SITEMAP_FOOTER = '</urlset>'
+
+
+ROBOTS_TEMPLATE = """User-agent: *
 Allow: /
 
 # Sitemaps
-Sitemap: {url_for('main.sitemap_xml', _external=True)}
+Sitemap: %s
 
 # Crawl-delay
 Crawl-delay: 1
@@ -31,106 +58,145 @@ Allow: /portfolio/
 Allow: /contact/
 Allow: /terminal/
 """
+
+
+@bp.route('/robots.txt')
+def robots_txt():
+    """Generate robots.txt file for search engine crawlers.
+    
+    The content only varies by host, so it is built once per host.
+    """
+    robots_content, etag = build_robots_txt(request.host_url)
     
-    return robots_content, 200, {'Content-Type': 'text/plain'}
+    response = make_response(robots_content, 200, {'Content-Type': 'text/plain'})
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=4)
+def build_robots_txt(host_url):
+    """Build robots.txt for a host.
+    
+    Args:
+        host_url (str): Host the sitemap URL is built for
+        
+    Returns:
+        tuple: (robots.txt content, ETag)
+    """
+    robots_content = ROBOTS_TEMPLATE % url_for('main.sitemap_xml', _external=True)
+    return robots_content, hashlib.sha1(robots_content.encode()).hexdigest()
 
 
 @bp.route('/sitemap.xml')
 def sitemap_xml():
-    """Generate XML sitemap for search engines."""
+    """Generate XML sitemap for search engines.
+    
+    The rendered XML is memoized on today's date, the host and what the sitemap
+    lists for the published posts (their slugs and lastmod dates), so crawler
+    hits only run one narrow query while nothing has changed. The ETag is
+    derived from the same key, so a crawler whose copy is current gets a 304
+    without the XML being rendered at all.
+    """
+    entries, last_change = sitemap_post_entries()
+    
+    now = datetime.utcnow()
+    today = now.date().isoformat()
     
-    # Get all published blog posts
-    blog_posts = BlogPost.query.filter_by(is_published=True).all()
+    # The entries fully determine the XML, so the ETag can be checked before rendering
+    etag = hashlib.sha1(f'{today}|{request.host_url}|{entries}'.encode()).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+        response.set_etag(etag)
+        return response
     
-    # Get all portfolio items
-    portfolio_items = PortfolioItem.query.all()
+    xml_content = render_sitemap_xml(today, request.host_url, entries)
+    
+    response = make_response(xml_content, 200, {'Content-Type': 'application/xml'})
+    response.set_etag(etag)
+    # Static pages carry today's date, so the sitemap changes at least daily
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    response.last_modified = max(midnight, last_change) if last_change else midnight
+    return response.make_conditional(request)
+
+
+def sitemap_post_entries():
+    """Fetch the (slug, lastmod) pairs the sitemap lists for the published posts.
+    
+    Returns:
+        tuple: ((slug, lastmod date string) pairs in post id order,
+                latest post update/creation time or None)
+    """
+    rows = db.session.query(BlogPost.slug, func.coalesce(BlogPost.updated_at, BlogPost.created_at))\
+                     .filter_by(is_published=True).order_by(BlogPost.id).all()
+    entries = tuple((slug, changed.date().isoformat()) for slug, changed in rows)
+    return entries, max((changed for _, changed in rows), default=None)
+
+
+@lru_cache(maxsize=4)
+def render_sitemap_xml(today, host_url, entries):
+    """Render the sitemap XML.
+    
+    Args:
+        today (str): Date used as lastmod for the static pages
+        host_url (str): Host the external URLs are built for
+        entries (tuple): (slug, lastmod) pairs of the published posts
+        
+    Returns:
+        str: Sitemap XML
+    """
+    parts = [SITEMAP_HEADER]
     
     # Static pages
-    static_pages = [
-        {
-            'url': url_for('main.index', _external=True),
-            'lastmod': datetime.utcnow().strftime('%Y-%m-%d'),
-            'changefreq': 'weekly',
-            'priority': '1.0'
-        },
-        {
-            'url': url_for('main.about', _external=True),
-            'lastmod': datetime.utcnow().strftime('%Y-%m-%d'),
-            'changefreq': 'monthly',
-            'priority': '0.8'
-        },
-        {
-            'url': url_for('main.portfolio', _external=True),
-            'lastmod': datetime.utcnow().strftime('%Y-%m-%d'),
-            'changefreq': 'weekly',
-            'priority': '0.9'
-        },
-        {
-            'url': url_for('main.contact', _external=True),
-            'lastmod': datetime.utcnow().strftime('%Y-%m-%d'),
-            'changefreq': 'monthly',
-            'priority': '0.7'
-        },
-        {
-            'url': url_for('main.terminal', _external=True),
-            'lastmod': datetime.utcnow().strftime('%Y-%m-%d'),
-            'changefreq': 'monthly',
-            'priority': '0.6'
-        },
-        {
-            'url': url_for('blog.index', _external=True),
-            'lastmod': datetime.utcnow().strftime('%Y-%m-%d'),
-            'changefreq': 'daily',
-            'priority': '0.9'
-        }
-    ]
-    
-    # Add blog posts
-    blog_urls = []
-    for post in blog_posts:
-        blog_urls.append({
-            'url': url_for('blog.post', slug=post.slug, _external=True),
-            'lastmod': post.updated_at.strftime('%Y-%m-%d') if post.updated_at else post.created_at.strftime('%Y-%m-%d'),
-            'changefreq': 'monthly',
-            'priority': '0.8'
-        })
-    
-    sitemap_template = """<?xml version="1.0" encoding="UTF-8"?>
-<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-    {% for page in static_pages %}
-    <url>
-        <loc>{{ page.url }}</loc>
-        <lastmod>{{ page.lastmod }}</lastmod>
-        <changefreq>{{ page.changefreq }}</changefreq>
-        <priority>{{ page.priority }}</priority>
-    </url>
-    {% endfor %}
-    {% for post in blog_urls %}
-    <url>
-        <loc>{{ post.url }}</loc>
-        <lastmod>{{ post.lastmod }}</lastmod>
-        <changefreq>{{ post.changefreq }}</changefreq>
-        <priority>{{ post.priority }}</priority>
-    </url>
-    {% endfor %}
-</urlset>"""
-    
-    xml_content = render_template_string(
-        sitemap_template,
-        static_pages=static_pages,
-        blog_urls=blog_urls
-    )
-    
-    return xml_content, 200, {'Content-Type': 'application/xml'}
+    for endpoint, changefreq, priority in STATIC_PAGE_SPECS:
+        parts.append(SITEMAP_URL_FORMAT.format(
+            url=escape(url_for(endpoint, _external=True)),
+            lastmod=today,
+            changefreq=changefreq,
+            priority=priority
+        ))
+    
+    # Blog posts
+    for slug, lastmod in entries:
+        parts.append(SITEMAP_URL_FORMAT.format(
+            url=escape(url_for('blog.post', slug=slug, _external=True)),
+            lastmod=lastmod,
+            changefreq='monthly',
+            priority='0.8'
+        ))
+    
+    parts.append(SITEMAP_FOOTER)
+    return ''.join(parts)
 
 
 @bp.route('/manifest.json')
 def manifest_json():
-    """Generate web app manifest for PWA capabilities."""
+    """Generate web app manifest for PWA capabilities.
+    
+    The manifest only depends on config, so it is serialized once per app and
+    browsers may reuse it for a day, then revalidate it with its ETag.
+    """
+    response = current_app.response_class(build_manifest_json(current_app._get_current_object()),
+                                          mimetype='application/json')
+    response.cache_control.public = True
+    response.cache_control.max_age = 86400
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+@lru_cache(maxsize=4)
+def build_manifest_json(app):
+    """Build and serialize the web app manifest for an app.
+    
+    Args:
+        app (Flask): Application whose config describes the site
+        
+    Returns:
+        str: Manifest JSON
+    """
     manifest = {
-        "name": f"{current_app.config['SITE_NAME']} - Terminal Interface",
-        "short_name": current_app.config['SITE_NAME'],
-        "description": current_app.config['SITE_TAGLINE'],
+        "name": f"{app.config['SITE_NAME']} - Terminal Interface",
+        "short_name": app.config['SITE_NAME'],
+        "description": app.config['SITE_TAGLINE'],
         "start_url": "/",
         "display": "standalone",
         "background_color": "#000012",
@@ -152,4 +218,4 @@ def manifest_json():
         "lang": "en"
     }
     
-    return manifest, 200, {'Content-Type': 'application/json'}
\ No newline at end of file
+    return app.json.dumps(manifest)
\ No newline at end of file
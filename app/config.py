@@ -4,6 +4,7 @@ Configuration settings for the hacker terminal personal brand page.
 
 import os
 from datetime import timedelta
+from types import MappingProxyType
 
 class Config:
     """Base configuration class."""
@@ -17,7 +18,29 @@ class Config:
     SQLALCHEMY_ENGINE_OPTIONS = {
         'pool_pre_ping': True,
         'pool_recycle': 300,
+        'future': True,
+        'query_cache_size': 1200,  # Compiled statement cache (default 500)
     }
+    # Connection pool per process for server databases (SQLAlchemy's default is 5 + 10 overflow);
+    # create_app only applies these when the database isn't SQLite
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 10))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 20))
+    # Run db.create_all() in create_app (dev convenience; off by default)
+    AUTO_CREATE_TABLES = os.environ.get('AUTO_CREATE_TABLES', 'false').lower() in ['true', 'on', '1']
+    # Run the homepage queries concurrently (worthwhile on a remote database, not SQLite)
+    PARALLEL_HOMEPAGE_QUERIES = os.environ.get('PARALLEL_HOMEPAGE_QUERIES', 'false').lower() in ['true', 'on', '1']
+    
+    # Cache configuration (SimpleCache is per-process; use RedisCache in production)
+    CACHE_TYPE = os.environ.get('CACHE_TYPE', 'SimpleCache')
+    CACHE_REDIS_URL = os.environ.get('CACHE_REDIS_URL')
+    CACHE_DEFAULT_TIMEOUT = int(os.environ.get('CACHE_DEFAULT_TIMEOUT', 300))
+    
+    # Response compression (used when Flask-Compress is installed); adds the
+    # sitemap, robots.txt and manifest types to Flask-Compress's defaults
+    COMPRESS_MIMETYPES = [
+        'text/html', 'text/css', 'text/xml', 'text/plain',
+        'application/json', 'application/javascript', 'application/xml',
+    ]
     
     # Security settings
     WTF_CSRF_ENABLED = True
@@ -58,8 +81,8 @@ class Config:
     RECAPTCHA_PUBLIC_KEY = os.environ.get('RECAPTCHA_PUBLIC_KEY')
     RECAPTCHA_PRIVATE_KEY = os.environ.get('RECAPTCHA_PRIVATE_KEY')
     
-    # Terminal theme colors
-    TERMINAL_COLORS = {
+    # Terminal theme colors (read-only, shared by every config class)
+    TERMINAL_COLORS = MappingProxyType({
         'primary': '#00ff00',    # Matrix green
         'secondary': '#0080ff',  # Cyber blue
         'warning': '#ffff00',    # Terminal yellow
@@ -67,7 +90,7 @@ class Config:
         'background': '#000012', # Deep space black
         'surface': '#001122',    # Dark blue-black
         'text': '#e0e0e0',      # Light gray text
-    }
+    })
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -88,7 +111,9 @@ class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     WTF_CSRF_ENABLED = False
+    CACHE_TYPE = 'NullCache'
 
 # Configuration dictionary
 config = {
@@ -2,30 +2,34 @@
 Email utilities for sending contact form messages and other notifications.
 """
 
-from flask import current_app, render_template_string
+from flask import current_app
 from flask_mail import Message
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from app import mail, render_cached_template_string
 import logging
+import re
+import time
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Module logger; handlers and levels are left to the application's logging config
 logger = logging.getLogger(__name__)
 
-def send_contact_form_email(name, email, subject, message):
-    """
-    Send contact form submission to the configured contact email.
-    
-    Args:
-        name (str): Sender's name
-        email (str): Sender's email
-        subject (str): Message subject
-        message (str): Message content
-    
-    Returns:
-        bool: True if email sent successfully, False otherwise
-    """
-    try:
-        # Email template for contact form
-        email_template = """
+# Background workers for email delivery; bounded so a burst of submissions
+# queues up instead of opening an SMTP connection per request
+_email_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='email')
+
+_STYLE_BLOCK = re.compile(r'<style>(.*?)</style>', re.DOTALL)
+
+def _minify_styles(html):
+    """Collapse the whitespace inside an HTML template's <style> blocks."""
+    def minify(match):
+        css = re.sub(r'\s+', ' ', match.group(1))
+        css = re.sub(r'\s*([{};:,])\s*', r'\1', css)
+        return f'<style>{css.strip()}</style>'
+    return _STYLE_BLOCK.sub(minify, html)
+
+# Email template for contact form (stylesheet minified once at import)
+CONTACT_EMAIL_HTML = _minify_styles("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -166,10 +170,10 @@ def send_contact_form_email(name, email, subject, message):
     </div>
 </body>
 </html>
-        """
-        
-        # Plain text version
-        text_template = """
+        """)
+
+# Plain text version of the contact form email
+CONTACT_EMAIL_TEXT = """
 New Contact Form Submission
 ==========================
 
@@ -184,56 +188,9 @@ Message:
 This message was sent via the contact form on dcblack.co.uk
 Reply directly to this email to respond to {{ name }}.
         """
-        
-        # Render templates
-        from datetime import datetime
-        html_body = render_template_string(email_template, 
-                                         name=name, 
-                                         email=email, 
-                                         subject=subject, 
-                                         message=message,
-                                         now=datetime.utcnow())
-        
-        text_body = render_template_string(text_template, 
-                                         name=name, 
-                                         email=email, 
-                                         subject=subject, 
-                                         message=message)
-        
-        # Create email message
-        msg = Message(
-            subject=f"Contact Form: {subject}" if subject else f"Contact Form Message from {name}",
-            recipients=[current_app.config['CONTACT_EMAIL']],
-            html=html_body,
-            body=text_body,
-            reply_to=email
-        )
-        
-        # Send email
-        from app import mail
-        mail.send(msg)
-        
-        logger.info(f"Contact form email sent successfully from {email}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Failed to send contact form email: {str(e)}")
-        return False
 
-def send_contact_confirmation_email(name, email):
-    """
-    Send a confirmation email to the person who submitted the contact form.
-    
-    Args:
-        name (str): Sender's name
-        email (str): Sender's email
-        
-    Returns:
-        bool: True if email sent successfully, False otherwise
-    """
-    try:
-        # Confirmation email template
-        confirmation_template = """
+# Confirmation email template (stylesheet minified once at import)
+CONFIRMATION_EMAIL_HTML = _minify_styles("""
 <!DOCTYPE html>
 <html>
 <head>
@@ -356,10 +313,10 @@ def send_contact_confirmation_email(name, email):
     </div>
 </body>
 </html>
-        """
-        
-        # Plain text version
-        text_confirmation = """
+        """)
+
+# Plain text version of the confirmation email
+CONFIRMATION_EMAIL_TEXT = """
 Message Received
 ================
 
@@ -378,10 +335,69 @@ Full-Stack Founder and Digital Nomad
 ---
 This is an automated confirmation. Please don't reply to this email.
         """
+
+def send_contact_form_email(name, email, subject, message):
+    """
+    Send contact form submission to the configured contact email.
+    
+    Args:
+        name (str): Sender's name
+        email (str): Sender's email
+        subject (str): Message subject
+        message (str): Message content
+    
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    try:
+        # Render templates
+        html_body = render_cached_template_string(CONTACT_EMAIL_HTML, 
+                                                name=name, 
+                                                email=email, 
+                                                subject=subject, 
+                                                message=message,
+                                                now=datetime.utcnow())
+        
+        text_body = render_cached_template_string(CONTACT_EMAIL_TEXT, 
+                                                name=name, 
+                                                email=email, 
+                                                subject=subject, 
+                                                message=message)
+        
+        # Create email message
+        msg = Message(
+            subject=f"Contact Form: {subject}" if subject else f"Contact Form Message from {name}",
+            recipients=[current_app.config['CONTACT_EMAIL']],
+            html=html_body,
+            body=text_body,
+            reply_to=email
+        )
+        
+        # Send email
+        mail.send(msg)
+        
+        logger.info("Contact form email sent successfully from %s", email)
+        return True
+        
+    except Exception as e:
+        logger.error("Failed to send contact form email: %s", e)
+        return False
+
+def send_contact_confirmation_email(name, email):
+    """
+    Send a confirmation email to the person who submitted the contact form.
+    
+    Args:
+        name (str): Sender's name
+        email (str): Sender's email
         
+    Returns:
+        bool: True if email sent successfully, False otherwise
+    """
+    try:
         # Render templates
-        html_body = render_template_string(confirmation_template, name=name)
-        text_body = render_template_string(text_confirmation, name=name)
+        html_body = render_cached_template_string(CONFIRMATION_EMAIL_HTML, name=name)
+        text_body = render_cached_template_string(CONFIRMATION_EMAIL_TEXT, name=name)
         
         # Create confirmation email
         msg = Message(
@@ -392,12 +408,58 @@ This is an automated confirmation. Please don't reply to this email.
         )
         
         # Send email
-        from app import mail
         mail.send(msg)
         
-        logger.info(f"Confirmation email sent to {email}")
+        logger.info("Confirmation email sent to %s", email)
         return True
         
     except Exception as e:
-        logger.error(f"Failed to send confirmation email: {str(e)}")
-        return False
\ No newline at end of file
+        logger.error("Failed to send confirmation email: %s", e)
+        return False
+
+def _send_with_retry(send, *args, retries=3, backoff=2):
+    """
+    Call an email sender until it succeeds, backing off exponentially between attempts.
+    
+    Args:
+        send (callable): Email function returning True on success
+        *args: Arguments passed through to the email function
+        retries (int): Maximum number of attempts
+        backoff (int): Base of the exponential delay (in seconds) between attempts
+    
+    Returns:
+        bool: True if the email was eventually sent, False otherwise
+    """
+    for attempt in range(retries):
+        if send(*args):
+            return True
+        if attempt < retries - 1:
+            time.sleep(backoff ** attempt)
+    return False
+
+def _send_in_app_context(app, send, *args):
+    """Run an email sender (with retries) inside the given app's context."""
+    with app.app_context():
+        return _send_with_retry(send, *args)
+
+def send_contact_emails_async(name, email, subject, message):
+    """
+    Queue the contact form notification and visitor confirmation on the
+    background email executor, so the request doesn't wait on the SMTP server.
+    
+    Args:
+        name (str): Sender's name
+        email (str): Sender's email
+        subject (str): Message subject
+        message (str): Message content
+    
+    Returns:
+        tuple: Futures for the notification and the confirmation email
+    """
+    app = current_app._get_current_object()
+    return (
+        _email_executor.submit(_send_in_app_context, app, send_contact_form_email,
+                               name, email, subject, message),
+        _email_executor.submit(_send_in_app_context, app, send_contact_confirmation_email,
+                               name, email)
+    )
@@ -5,7 +5,7 @@ WTForms for the hacker terminal personal brand page.
 from flask import current_app
 from flask_wtf import FlaskForm
 from flask_wtf.file import FileField, FileAllowed
-from wtforms import StringField, TextAreaField, PasswordField, BooleanField, SelectField, HiddenField, RadioField
+from wtforms import StringField, TextAreaField, PasswordField, BooleanField, SelectField, HiddenField, RadioField, SubmitField
 from wtforms.validators import DataRequired, Email, Length, EqualTo, Optional, URL, ValidationError
 from wtforms.widgets import TextArea
 from app.models import User, Tag
@@ -18,26 +18,33 @@ except ImportError:
     RECAPTCHA_AVAILABLE = False
     RecaptchaField = None
 
+# Validators are stateless, so the common ones are built once and shared
+_REQUIRED = DataRequired()
+_OPTIONAL = Optional()
+_EMAIL = Email()
+_URL = URL()
+_NAME_LENGTH = Length(min=2, max=100)
+
 class LoginForm(FlaskForm):
     """Login form for user authentication."""
-    username = StringField('Username', validators=[DataRequired()], 
+    username = StringField('Username', validators=[_REQUIRED], 
                           render_kw={'placeholder': 'Enter username', 'class': 'terminal-input'})
-    password = PasswordField('Password', validators=[DataRequired()], 
+    password = PasswordField('Password', validators=[_REQUIRED], 
                            render_kw={'placeholder': 'Enter password', 'class': 'terminal-input'})
     remember_me = BooleanField('Remember Me')
-    submit = StringField('Login', render_kw={'class': 'terminal-button', 'value': 'access granted'})
+    submit = SubmitField('access granted', render_kw={'class': 'terminal-button'})
 
 class ContactForm(FlaskForm):
     """Contact form for visitor inquiries."""
-    name = StringField('Name', validators=[DataRequired(), Length(min=2, max=100)],
+    name = StringField('Name', validators=[_REQUIRED, _NAME_LENGTH],
                       render_kw={'placeholder': 'Your name', 'class': 'terminal-input'})
-    email = StringField('Email', validators=[DataRequired(), Email()],
+    email = StringField('Email', validators=[_REQUIRED, _EMAIL],
                        render_kw={'placeholder': 'your.email@domain.com', 'class': 'terminal-input'})
-    subject = StringField('Subject', validators=[Optional(), Length(max=200)],
+    subject = StringField('Subject', validators=[_OPTIONAL, Length(max=200)],
                          render_kw={'placeholder': 'Message subject', 'class': 'terminal-input'})
-    message = TextAreaField('Message', validators=[DataRequired(), Length(min=10, max=2000)],
+    message = TextAreaField('Message', validators=[_REQUIRED, Length(min=10, max=2000)],
                            render_kw={'placeholder': 'Your message...', 'class': 'terminal-textarea', 'rows': 8})
-    submit = StringField('Send Message', render_kw={'class': 'terminal-button', 'value': 'transmit'})
+    submit = SubmitField('transmit', render_kw={'class': 'terminal-button'})
     
     @property
     def has_recaptcha(self):
@@ -52,33 +59,49 @@ if RECAPTCHA_AVAILABLE:
     class ContactFormWithRecaptcha(ContactForm):
         """Contact form with reCAPTCHA field."""
         recaptcha = RecaptchaField()
+        
+        def validate(self, extra_validators=None):
+            """Validate the local fields first and only verify reCAPTCHA if they pass.
+            
+            Verifying reCAPTCHA is a round trip to Google, so incomplete or
+            malformed submissions are rejected without paying for it.
+            """
+            recaptcha = self._fields.pop('recaptcha')
+            try:
+                if not super().validate(extra_validators):
+                    return False
+            finally:
+                self._fields['recaptcha'] = recaptcha
+            
+            extra = extra_validators.get('recaptcha', ()) if extra_validators else ()
+            return recaptcha.validate(self, extra)
 
 class BlogPostForm(FlaskForm):
     """Form for creating and editing blog posts."""
-    title = StringField('Title', validators=[DataRequired(), Length(min=5, max=200)],
+    title = StringField('Title', validators=[_REQUIRED, Length(min=5, max=200)],
                        render_kw={'placeholder': 'Enter post title', 'class': 'terminal-input'})
-    content = TextAreaField('Content', validators=[DataRequired()],
+    content = TextAreaField('Content', validators=[_REQUIRED],
                            render_kw={'placeholder': 'Write your post content...', 'class': 'terminal-textarea', 'rows': 20})
-    excerpt = TextAreaField('Excerpt', validators=[Optional()],
+    excerpt = TextAreaField('Excerpt', validators=[_OPTIONAL],
                            render_kw={'placeholder': 'Brief description (optional)', 'class': 'terminal-textarea', 'rows': 3})
-    meta_description = StringField('Meta Description', validators=[Optional(), Length(max=160)],
+    meta_description = StringField('Meta Description', validators=[_OPTIONAL, Length(max=160)],
                                   render_kw={'placeholder': 'SEO meta description', 'class': 'terminal-input'})
-    meta_keywords = StringField('Meta Keywords', validators=[Optional()],
+    meta_keywords = StringField('Meta Keywords', validators=[_OPTIONAL],
                                render_kw={'placeholder': 'keyword1, keyword2, keyword3', 'class': 'terminal-input'})
     is_published = BooleanField('Publish immediately')
-    tags = StringField('Tags', validators=[Optional()],
+    tags = StringField('Tags', validators=[_OPTIONAL],
                       render_kw={'placeholder': 'tag1, tag2, tag3', 'class': 'terminal-input'})
-    submit = StringField('Save Post', render_kw={'class': 'terminal-button', 'value': 'save'})
+    submit = SubmitField('save', render_kw={'class': 'terminal-button'})
 
 class PortfolioItemForm(FlaskForm):
     """Form for managing portfolio items."""
-    title = StringField('Project Title', validators=[DataRequired(), Length(min=2, max=100)],
+    title = StringField('Project Title', validators=[_REQUIRED, _NAME_LENGTH],
                        render_kw={'placeholder': 'Project name', 'class': 'terminal-input'})
-    description = TextAreaField('Description', validators=[DataRequired()],
+    description = TextAreaField('Description', validators=[_REQUIRED],
                                render_kw={'placeholder': 'Project description...', 'class': 'terminal-textarea', 'rows': 5})
-    url = StringField('Live URL', validators=[Optional(), URL()],
+    url = StringField('Live URL', validators=[_OPTIONAL, _URL],
                      render_kw={'placeholder': 'https://example.com', 'class': 'terminal-input'})
-    github_url = StringField('GitHub URL', validators=[Optional(), URL()],
+    github_url = StringField('GitHub URL', validators=[_OPTIONAL, _URL],
                             render_kw={'placeholder': 'https://github.com/user/repo', 'class': 'terminal-input'})
     
     # Image options - either upload a file or provide a URL
@@ -86,12 +109,12 @@ class PortfolioItemForm(FlaskForm):
                              choices=[('upload', 'Upload Image'), ('url', 'Image URL')],
                              default='upload')
     image_file = FileField('Upload Image', 
-                          validators=[Optional(), FileAllowed(['jpg', 'jpeg', 'png', 'gif', 'webp'], 'Images only!')],
+                          validators=[_OPTIONAL, FileAllowed(['jpg', 'jpeg', 'png', 'gif', 'webp'], 'Images only!')],
                           render_kw={'class': 'terminal-input', 'accept': 'image/*'})
-    image_url = StringField('Image URL', validators=[Optional(), URL()],
+    image_url = StringField('Image URL', validators=[_OPTIONAL, _URL],
                            render_kw={'placeholder': 'https://example.com/image.jpg', 'class': 'terminal-input'})
     
-    technologies = StringField('Technologies', validators=[Optional()],
+    technologies = StringField('Technologies', validators=[_OPTIONAL],
                               render_kw={'placeholder': 'Python, Flask, React, etc.', 'class': 'terminal-input'})
     status = SelectField('Status', choices=[
         ('live', 'Live'),
@@ -99,44 +122,49 @@ class PortfolioItemForm(FlaskForm):
         ('archived', 'Archived')
     ], default='live')
     is_featured = BooleanField('Featured Project')
-    sort_order = StringField('Sort Order', validators=[Optional()],
+    sort_order = StringField('Sort Order', validators=[_OPTIONAL],
                             render_kw={'placeholder': '0', 'class': 'terminal-input'})
-    submit = StringField('Save Project', render_kw={'class': 'terminal-button', 'value': 'save'})
+    submit = SubmitField('save', render_kw={'class': 'terminal-button'})
 
 class TagForm(FlaskForm):
     """Form for managing blog tags."""
-    name = StringField('Tag Name', validators=[DataRequired(), Length(min=2, max=50)],
+    name = StringField('Tag Name', validators=[_REQUIRED, Length(min=2, max=50)],
                       render_kw={'placeholder': 'Tag name', 'class': 'terminal-input'})
-    description = TextAreaField('Description', validators=[Optional()],
+    description = TextAreaField('Description', validators=[_OPTIONAL],
                                render_kw={'placeholder': 'Tag description...', 'class': 'terminal-textarea', 'rows': 3})
-    color = StringField('Color', validators=[Optional()],
+    color = StringField('Color', validators=[_OPTIONAL],
                        render_kw={'placeholder': '#00ff00', 'class': 'terminal-input'})
-    submit = StringField('Save Tag', render_kw={'class': 'terminal-button', 'value': 'save'})
+    submit = SubmitField('save', render_kw={'class': 'terminal-button'})
 
 class SearchForm(FlaskForm):
     """Search form for blog posts."""
-    query = StringField('Search', validators=[DataRequired()],
+    class Meta:
+        # Submitted via GET and never validated; skips generating a CSRF
+        # token (and writing it to the session) on every blog index render
+        csrf = False
+    
+    query = StringField('Search', validators=[_REQUIRED],
                        render_kw={'placeholder': 'Search posts...', 'class': 'terminal-input'})
-    submit = StringField('Search', render_kw={'class': 'terminal-button', 'value': 'search'})
+    submit = SubmitField('search', render_kw={'class': 'terminal-button'})
 
 class TerminalCommandForm(FlaskForm):
     """Form for terminal command input."""
-    command = StringField('Command', validators=[DataRequired()],
+    command = StringField('Command', validators=[_REQUIRED],
                          render_kw={'placeholder': 'Type a command...', 'class': 'terminal-command-input', 'autocomplete': 'off'})
     submit = HiddenField()
 
 class UserProfileForm(FlaskForm):
     """Form for updating user profile information."""
-    username = StringField('Username', validators=[DataRequired(), Length(min=3, max=80)],
+    username = StringField('Username', validators=[_REQUIRED, Length(min=3, max=80)],
                           render_kw={'placeholder': 'Enter username', 'class': 'terminal-input'})
-    current_password = PasswordField('Current Password', validators=[DataRequired()],
+    current_password = PasswordField('Current Password', validators=[_REQUIRED],
                                    render_kw={'placeholder': 'Enter current password', 'class': 'terminal-input'})
-    new_password = PasswordField('New Password', validators=[Optional(), Length(min=6, max=100)],
+    new_password = PasswordField('New Password', validators=[_OPTIONAL, Length(min=6, max=100)],
                                render_kw={'placeholder': 'Enter new password (optional)', 'class': 'terminal-input'})
     confirm_password = PasswordField('Confirm New Password', 
                                    validators=[EqualTo('new_password', message='Passwords must match')],
                                    render_kw={'placeholder': 'Confirm new password', 'class': 'terminal-input'})
-    submit = StringField('Update Profile', render_kw={'class': 'terminal-button', 'value': 'update'})
+    submit = SubmitField('update', render_kw={'class': 'terminal-button'})
     
     def __init__(self, original_username, *args, **kwargs):
         super(UserProfileForm, self).__init__(*args, **kwargs)
@@ -3,9 +3,40 @@ GitHub API integration for fetching real commit statistics.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from functools import lru_cache
+from app import cache
+import atexit
 import os
+import threading
+
+# Per-repo commit requests are independent, so they are issued concurrently.
+# Eight at a time stays well clear of GitHub's secondary rate limits.
+_request_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='github')
+
+# Most recent (ETag, JSON) responses kept per instance for conditional requests
+ETAG_CACHE_SIZE = 256
+
+# Commit counts and profile stats in one GraphQL request (needs a token)
+USER_OVERVIEW_QUERY = """
+query($login: String!, $monthStart: DateTime!, $recentStart: DateTime!) {
+  user(login: $login) {
+    month: contributionsCollection(from: $monthStart) { totalCommitContributions }
+    recent: contributionsCollection(from: $recentStart) { totalCommitContributions }
+    repositories(privacy: PUBLIC, ownerAffiliations: OWNER) { totalCount }
+    followers { totalCount }
+    following { totalCount }
+    createdAt
+    bio
+    location
+    websiteUrl
+    avatarUrl
+  }
+}
+"""
 
 class GitHubStats:
     """GitHub API integration class for fetching repository and commit statistics.
@@ -18,6 +49,13 @@ class GitHubStats:
         self.username = username or self._extract_username_from_url()
         self.api_base = "https://api.github.com"
         self.headers = self._get_headers()
+        self.session = self._create_session()
+        self._etags = OrderedDict()
+        self._etag_lock = threading.Lock()
+    
+    def __repr__(self):
+        # Used by cache.memoize to key per-user results consistently across workers
+        return f'GitHubStats({self.username!r})'
         
     def _get_headers(self):
         """Construct HTTP headers for GitHub API requests with optional authentication.
@@ -36,6 +74,70 @@ class GitHubStats:
             
         return headers
         
+    def _create_session(self):
+        """Create the HTTP session shared by all GitHub API requests.
+        
+        Every request goes to api.github.com, so a single pooled session keeps
+        the TLS connection alive between calls instead of reconnecting for each
+        repository. Gateway errors are retried with a short backoff.
+        
+        Returns:
+            requests.Session: Session with the API headers attached
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+        retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                      allowed_methods=['GET'])
+        session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=20, max_retries=retry))
+        return session
+    
+    def _get_json(self, url, params=None, timeout=10):
+        """GET a GitHub API resource, revalidating any earlier copy with its ETag.
+        
+        GitHub answers an unchanged resource with an empty 304, which doesn't
+        count against the rate limit, so the last response for each URL is kept
+        (up to ETAG_CACHE_SIZE of them) and reused when it is still current.
+        
+        Args:
+            url (str): API URL
+            params (dict): Query parameters
+            timeout (int): Request timeout in seconds
+            
+        Returns:
+            The decoded JSON body, or None on any other response
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._etag_lock:
+            cached = self._etags.get(key)
+        
+        headers = {'If-None-Match': cached[0]} if cached else None
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
+        
+        if response.status_code == 304 and cached:
+            with self._etag_lock:
+                if key in self._etags:
+                    self._etags.move_to_end(key)
+            return cached[1]
+        if response.status_code != 200:
+            return None
+        
+        data = response.json()
+        etag = response.headers.get('ETag')
+        if etag:
+            with self._etag_lock:
+                self._etags[key] = (etag, data)
+                self._etags.move_to_end(key)
+                if len(self._etags) > ETAG_CACHE_SIZE:
+                    self._etags.popitem(last=False)
+        return data
+    
+    def close(self):
+        """Close the pooled connections held by the HTTP session."""
+        self.session.close()
+        
     def _extract_username_from_url(self):
         """Extract GitHub username from the GITHUB_URL environment variable.
         
@@ -49,15 +151,19 @@ class GitHubStats:
             return github_url.split('github.com/')[-1].rstrip('/')
         return None
     
-    @lru_cache(maxsize=32)
+    @cache.memoize(timeout=1800, response_filter=bool)
     def get_user_repos(self):
-        """Fetch user's repositories with caching for performance.
+        """Fetch user's repositories, cached for 30 minutes in the app cache.
         
         Returns public repositories for unauthenticated requests, or all repositories
         (public + private) if a GitHub token is provided.
         
+        Only the fields this module uses are kept, so the cached list stays a few
+        KB rather than the full GitHub payload.
+        
         Returns:
-            list: List of repository objects from GitHub API, empty list on error
+            list: List of {'name', 'full_name'} dicts, most recently updated first;
+                empty list on error
         """
         if not self.username:
             return []
@@ -75,100 +181,186 @@ class GitHubStats:
                 'per_page': 100
             }
             
-            response = requests.get(url, params=params, headers=self.headers, timeout=10)
-            if response.status_code == 200:
-                return response.json()
+            repos = self._get_json(url, params=params)
+            if repos is not None:
+                return [{'name': repo['name'], 'full_name': repo['full_name']}
+                        for repo in repos]
             return []
         except requests.RequestException:
             return []
     
+    def _get_repo_commits(self, repo_name, since, per_page, timeout):
+        """Fetch the user's commits to one repository since a date.
+        
+        Args:
+            repo_name (str): Full repository name (owner/repo)
+            since (str): ISO 8601 timestamp to list commits from
+            per_page (int): Maximum number of commits to return
+            timeout (int): Request timeout in seconds
+            
+        Returns:
+            list: Commit objects from the GitHub API, empty list on a non-200 response
+        """
+        commits_url = f"{self.api_base}/repos/{repo_name}/commits"
+        params = {
+            'author': self.username,
+            'since': since,
+            'per_page': per_page
+        }
+        
+        commits = self._get_json(commits_url, params=params, timeout=timeout)
+        return commits if commits is not None else []
+    
+    def _get_commits_for_repos(self, repos, since, per_page=10, timeout=5):
+        """Fetch the user's commits to several repositories concurrently.
+        
+        Args:
+            repos (list): Repository dicts with a 'full_name' key
+            since (str): ISO 8601 timestamp to list commits from
+            per_page (int): Maximum number of commits per repository
+            timeout (int): Request timeout in seconds
+            
+        Returns:
+            list: One list of commits per repository, in the order given
+            
+        Raises:
+            requests.RequestException: If any of the requests fails
+        """
+        return list(_request_executor.map(
+            lambda repo: self._get_repo_commits(repo['full_name'], since, per_page, timeout),
+            repos
+        ))
+    
+    def _count_commits_since(self, since):
+        """Count the user's commits authored on or after a date.
+        
+        Uses the commit search API, which returns the total across all of the
+        user's repositories in a single request.
+        
+        Args:
+            since (str): Date to count from (YYYY-MM-DD)
+            
+        Returns:
+            int: Number of matching commits
+            
+        Raises:
+            requests.RequestException: If the request fails or is rejected
+        """
+        params = {
+            'q': f'author:{self.username} author-date:>={since}',
+            'per_page': 1
+        }
+        
+        response = self.session.get(f"{self.api_base}/search/commits", params=params, timeout=10)
+        response.raise_for_status()
+        return response.json().get('total_count', 0)
+    
+    def _graphql(self, query, variables):
+        """Run a query against the GitHub GraphQL API.
+        
+        Args:
+            query (str): GraphQL query document
+            variables (dict): Query variables
+            
+        Returns:
+            dict: The response's data object
+            
+        Raises:
+            requests.RequestException: If the request fails or the query returns errors
+        """
+        response = self.session.post(f"{self.api_base}/graphql",
+                                     json={'query': query, 'variables': variables}, timeout=10)
+        response.raise_for_status()
+        payload = response.json()
+        if payload.get('errors'):
+            raise requests.RequestException(payload['errors'][0].get('message', 'GraphQL query failed'))
+        return payload['data']
+    
+    @cache.memoize(timeout=600)
+    def _get_user_overview(self):
+        """Fetch this month's and the last 30 days' commit counts plus profile stats.
+        
+        One GraphQL request answers both get_commits_this_month and
+        get_profile_stats. The GraphQL API only accepts authenticated requests,
+        so callers use it only when GITHUB_TOKEN is set. Cached for 10 minutes in
+        the app cache.
+        
+        Returns:
+            dict: The GraphQL user object
+            
+        Raises:
+            requests.RequestException: If the request fails or the user doesn't exist
+        """
+        now = datetime.now()
+        month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        data = self._graphql(USER_OVERVIEW_QUERY, {
+            'login': self.username,
+            'monthStart': month_start.isoformat() + 'Z',
+            'recentStart': (now - timedelta(days=30)).isoformat() + 'Z'
+        })
+        if not data.get('user'):
+            raise requests.RequestException(f"GitHub user not found: {self.username}")
+        return data['user']
+    
+    @cache.memoize(timeout=600, response_filter=lambda result: 'error' not in result)
     def get_commits_this_month(self):
         """Calculate total commit count for the current month across user's repositories.
         
-        Searches through the user's most recently updated repositories to count commits
-        made by the user this month. Falls back to last 30 days if no commits found.
+        Counts the commits made by the user this month, from the GraphQL user
+        overview when a token is configured and otherwise with one commit search
+        query. Falls back to last 30 days if no commits found. Successful results
+        are cached for 10 minutes in the app cache.
         
         Returns:
-            dict: Contains commit count, time period, username, and repos checked
+            dict: Contains commit count, time period and username
         """
         if not self.username:
             return {"count": 0, "error": "No GitHub username configured"}
             
         try:
-            # Get first day of current month
             now = datetime.now()
-            first_day = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-            since = first_day.isoformat() + 'Z'
-            
-            # If it's early in the month, also check last 30 days as fallback
-            fallback_since = (now - timedelta(days=30)).isoformat() + 'Z'
-            
-            total_commits = 0
-            repos = self.get_user_repos()
-            
-            # Limit to most active repos to avoid rate limiting
-            active_repos = repos[:20] if repos else []
+            time_period = now.strftime("%B %Y")
             
-            for repo in active_repos:
-                repo_name = repo['full_name']
-                
-                # Get commits for this repo this month
-                commits_url = f"{self.api_base}/repos/{repo_name}/commits"
-                params = {
-                    'author': self.username,
-                    'since': since,
-                    'per_page': 100
-                }
+            if os.environ.get('GITHUB_TOKEN'):
+                # Both windows come back from the same request
+                overview = self._get_user_overview()
+                total_commits = overview['month']['totalCommitContributions']
+                if total_commits == 0:
+                    total_commits = overview['recent']['totalCommitContributions']
+                    time_period = "Last 30 Days"
+            else:
+                # Get first day of current month
+                since = now.replace(day=1).date().isoformat()
                 
-                response = requests.get(commits_url, params=params, headers=self.headers, timeout=10)
-                if response.status_code == 200:
-                    commits = response.json()
-                    total_commits += len(commits)
-                    
-                    # If we got 100 commits, there might be more (pagination)
-                    if len(commits) == 100:
-                        # For simplicity, we'll estimate there might be more
-                        # In a production app, you'd implement full pagination
-                        pass
-            
-            # If no commits this month, try last 30 days
-            time_period = now.strftime("%B %Y")
-            if total_commits == 0:
-                print(f"No commits found for {time_period}, checking last 30 days...")
+                # If it's early in the month, also check last 30 days as fallback
+                fallback_since = (now - timedelta(days=30)).date().isoformat()
                 
-                total_commits = 0
-                for repo in active_repos:
-                    repo_name = repo['full_name']
-                    
-                    commits_url = f"{self.api_base}/repos/{repo_name}/commits"
-                    params = {
-                        'author': self.username,
-                        'since': fallback_since,
-                        'per_page': 100
-                    }
-                    
-                    response = requests.get(commits_url, params=params, headers=self.headers, timeout=10)
-                    if response.status_code == 200:
-                        commits = response.json()
-                        total_commits += len(commits)
+                total_commits = self._count_commits_since(since)
                 
-                time_period = "Last 30 Days"
+                # If no commits this month, try last 30 days (unless this month
+                # already covers them, in which case there are none either)
+                if total_commits == 0:
+                    if fallback_since < since:
+                        print(f"No commits found for {time_period}, checking last 30 days...")
+                        total_commits = self._count_commits_since(fallback_since)
+                    time_period = "Last 30 Days"
             
             return {
                 "count": total_commits,
                 "month": time_period,
-                "username": self.username,
-                "repos_checked": len(active_repos)
+                "username": self.username
             }
             
         except requests.RequestException as e:
             return {"count": 0, "error": f"API request failed: {str(e)}"}
     
+    @cache.memoize(timeout=600, response_filter=bool)
     def get_recent_activity(self, days=7):
         """Fetch recent commit activity across user's repositories.
         
         Searches through the most recently updated repositories to find commits
-        made by the user within the specified time period.
+        made by the user within the specified time period. Non-empty results are
+        cached for 10 minutes in the app cache.
         
         Args:
             days (int): Number of days to look back (default: 7)
@@ -180,8 +372,9 @@ class GitHubStats:
             return []
             
         try:
-            # Get date N days ago
-            since_date = datetime.now() - timedelta(days=days)
+            # Get date N days ago (whole days, so repeat requests share a URL
+            # and can be revalidated with an ETag)
+            since_date = (datetime.now() - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
             since = since_date.isoformat() + 'Z'
             
             activity = []
@@ -190,27 +383,16 @@ class GitHubStats:
             # Check most recently updated repos
             recent_repos = repos[:10] if repos else []
             
-            for repo in recent_repos:
-                repo_name = repo['full_name']
-                
-                commits_url = f"{self.api_base}/repos/{repo_name}/commits"
-                params = {
-                    'author': self.username,
-                    'since': since,
-                    'per_page': 10
-                }
-                
-                response = requests.get(commits_url, params=params, headers=self.headers, timeout=5)
-                if response.status_code == 200:
-                    commits = response.json()
-                    
-                    for commit in commits:
-                        activity.append({
-                            'repo': repo['name'],
-                            'message': commit['commit']['message'],
-                            'date': commit['commit']['author']['date'],
-                            'url': commit['html_url']
-                        })
+            repo_commits = self._get_commits_for_repos(recent_repos, since)
+            
+            for repo, commits in zip(recent_repos, repo_commits):
+                for commit in commits:
+                    activity.append({
+                        'repo': repo['name'],
+                        'message': commit['commit']['message'],
+                        'date': commit['commit']['author']['date'],
+                        'url': commit['html_url']
+                    })
             
             # Sort by date (most recent first)
             activity.sort(key=lambda x: x['date'], reverse=True)
@@ -219,11 +401,14 @@ class GitHubStats:
         except requests.RequestException:
             return []
     
+    @cache.memoize(timeout=3600, response_filter=bool)
     def get_profile_stats(self):
         """Fetch GitHub user profile statistics and information.
         
         Retrieves public profile data including repository count, followers,
-        following, account creation date, bio, location, and avatar.
+        following, account creation date, bio, location, and avatar, from the
+        GraphQL user overview when a token is configured. Cached for an hour in
+        the app cache.
         
         Returns:
             dict: Profile statistics and information, empty dict on error
@@ -232,11 +417,23 @@ class GitHubStats:
             return {}
             
         try:
+            if os.environ.get('GITHUB_TOKEN'):
+                overview = self._get_user_overview()
+                return {
+                    'public_repos': overview['repositories']['totalCount'],
+                    'followers': overview['followers']['totalCount'],
+                    'following': overview['following']['totalCount'],
+                    'created_at': overview['createdAt'],
+                    'bio': overview['bio'],
+                    'location': overview['location'],
+                    'blog': overview['websiteUrl'] or '',
+                    'avatar_url': overview['avatarUrl']
+                }
+            
             url = f"{self.api_base}/users/{self.username}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            data = self._get_json(url)
             
-            if response.status_code == 200:
-                data = response.json()
+            if data is not None:
                 return {
                     'public_repos': data.get('public_repos', 0),
                     'followers': data.get('followers', 0),
@@ -252,5 +449,21 @@ class GitHubStats:
         except requests.RequestException:
             return {}
 
-# Global instance
-github_stats = GitHubStats()
\ No newline at end of file
+# Shared instance, built on first use so importing this module stays cheap
+_github_stats = None
+_github_stats_lock = threading.Lock()
+
+def get_github_stats():
+    """Get the shared GitHubStats instance, creating it on first call.
+    
+    Returns:
+        GitHubStats: Instance for the configured GitHub user
+    """
+    global _github_stats
+    if _github_stats is None:
+        with _github_stats_lock:
+            if _github_stats is None:
+                instance = GitHubStats()
+                atexit.register(instance.close)
+                _github_stats = instance
+    return _github_stats
\ No newline at end of file
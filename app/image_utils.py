@@ -5,12 +5,29 @@ Handles image resizing, optimization, and file management for portfolio items.
 Recommended portfolio image size: 1200x800px (3:2 aspect ratio) for best display.
 """
 
+import io
 import os
 import uuid
 from PIL import Image, ImageOps
 from werkzeug.utils import secure_filename
 from flask import current_app
 
+# libvips is optional; Pillow handles resizing without it
+try:
+    import pyvips
+    VIPS_AVAILABLE = True
+except ImportError:
+    pyvips = None
+    VIPS_AVAILABLE = False
+
+# mozjpeg's lossless pass is optional; JPEGs are written as encoded without it
+try:
+    import mozjpeg_lossless_optimization
+    MOZJPEG_AVAILABLE = True
+except ImportError:
+    mozjpeg_lossless_optimization = None
+    MOZJPEG_AVAILABLE = False
+
 # Allowed image extensions
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 
@@ -20,40 +37,57 @@ PORTFOLIO_IMAGE_HEIGHT = 800
 
 def allowed_file(filename):
     """Check if the file extension is allowed."""
-    return '.' in filename and \
-           filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    ext = os.path.splitext(filename)[1][1:].lower()
+    return ext in ALLOWED_EXTENSIONS
 
 def generate_unique_filename(original_filename):
     """Generate a unique filename to prevent conflicts."""
     # Get file extension
-    ext = original_filename.rsplit('.', 1)[1].lower() if '.' in original_filename else 'jpg'
+    ext = os.path.splitext(original_filename)[1][1:].lower() or 'jpg'
     
     # Generate unique filename with UUID
     unique_filename = f"portfolio_{uuid.uuid4().hex[:12]}.{ext}"
     return unique_filename
 
-def resize_and_optimize_image(image_path, max_width=PORTFOLIO_IMAGE_WIDTH, max_height=PORTFOLIO_IMAGE_HEIGHT, quality=85):
+def resize_and_optimize_image(image_path, max_width=PORTFOLIO_IMAGE_WIDTH, max_height=PORTFOLIO_IMAGE_HEIGHT, quality=85,
+                              source=None):
     """
     Resize and optimize an image for portfolio display.
     
     Args:
-        image_path (str): Path to the image file
+        image_path (str): Path to the image file; the result is written here
         max_width (int): Maximum width in pixels
         max_height (int): Maximum height in pixels
         quality (int): JPEG quality (1-100)
+        source (file): Seekable file object to read the image from instead of
+            image_path (e.g. an upload stream), so the original never hits disk
     
     Returns:
         bool: True if successful, False otherwise
     """
+    if VIPS_AVAILABLE:
+        try:
+            _resize_with_vips(image_path, max_width, max_height, quality, source)
+            return True
+        except pyvips.Error as e:
+            current_app.logger.warning(f"libvips image processing failed, retrying with Pillow: {str(e)}")
+            if source is not None:
+                source.seek(0)
+    
     try:
-        with Image.open(image_path) as img:
+        with Image.open(source if source is not None else image_path) as img:
+            # Let the JPEG decoder scale down by 1/2, 1/4 or 1/8 while decoding,
+            # keeping at least twice the target size for the LANCZOS resize below
+            if img.format == 'JPEG':
+                img.draft('RGB', (max_width * 2, max_height * 2))
+            
             # Convert to RGB if necessary (handles RGBA, P mode images)
             if img.mode in ('RGBA', 'P'):
                 # Create a white background for transparency
                 background = Image.new('RGB', img.size, (255, 255, 255))
                 if img.mode == 'P':
                     img = img.convert('RGBA')
-                background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+                background.paste(img, mask=img.getchannel('A') if img.mode == 'RGBA' else None)
                 img = background
             elif img.mode != 'RGB':
                 img = img.convert('RGB')
@@ -80,7 +114,9 @@ def resize_and_optimize_image(image_path, max_width=PORTFOLIO_IMAGE_WIDTH, max_h
                 img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
             
             # Save with optimization
-            img.save(image_path, 'JPEG', quality=quality, optimize=True)
+            buffer = io.BytesIO()
+            img.save(buffer, 'JPEG', quality=quality, optimize=True)
+            _write_jpeg(image_path, buffer.getvalue())
             
             return True
             
@@ -88,10 +124,63 @@ def resize_and_optimize_image(image_path, max_width=PORTFOLIO_IMAGE_WIDTH, max_h
         current_app.logger.error(f"Image processing failed: {str(e)}")
         return False
 
+def _resize_with_vips(image_path, max_width, max_height, quality, source=None):
+    """
+    Resize and optimize an image in place with libvips.
+    
+    thumbnail() shrinks while decoding where the format allows it, applies the
+    EXIF orientation and keeps the aspect ratio, and libvips streams the image
+    in tiles, so large uploads never sit fully decoded in memory. Produces the
+    same output as the Pillow path: an RGB JPEG on a white background.
+    
+    Args:
+        image_path (str): Path to the image file; the result is written here
+        max_width (int): Maximum width in pixels
+        max_height (int): Maximum height in pixels
+        quality (int): JPEG quality (1-100)
+        source (file): File object to read the image from instead of image_path
+    
+    Raises:
+        pyvips.Error: If the image can't be processed
+    """
+    if source is not None:
+        image = pyvips.Image.thumbnail_buffer(source.read(), max_width, height=max_height, size='down')
+    else:
+        image = pyvips.Image.thumbnail(image_path, max_width, height=max_height, size='down')
+    
+    # Flatten transparency onto white and make sure the output is sRGB
+    if image.hasalpha():
+        image = image.flatten(background=[255, 255, 255])
+    if image.interpretation != 'srgb':
+        image = image.colourspace('srgb')
+    
+    # Encode to memory first; the source file may still be being read from
+    _write_jpeg(image_path, image.jpegsave_buffer(Q=quality, optimize_coding=True, strip=True))
+
+def _write_jpeg(image_path, data):
+    """
+    Write encoded JPEG data to a file, shrinking it losslessly with mozjpeg first if available.
+    
+    mozjpeg re-encodes the Huffman tables and switches to progressive
+    encoding without touching the pixels, typically saving 5-15% on size.
+    
+    Args:
+        image_path (str): Path to write the image to
+        data (bytes): Encoded JPEG data
+    """
+    if MOZJPEG_AVAILABLE:
+        data = mozjpeg_lossless_optimization.optimize(data)
+    
+    with open(image_path, 'wb') as f:
+        f.write(data)
+
 def save_portfolio_image(uploaded_file):
     """
     Save and process an uploaded portfolio image.
     
+    The upload is checked to be a readable image, then decoded straight from
+    the request stream, so only the optimized image is ever written to disk.
+    
     Args:
         uploaded_file: Flask uploaded file object
         
@@ -104,6 +193,16 @@ def save_portfolio_image(uploaded_file):
     if not allowed_file(uploaded_file.filename):
         return False, None, f"Invalid file type. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
     
+    # Reject anything Pillow can't identify now; verify() reads the headers
+    # without decoding the image
+    try:
+        with Image.open(uploaded_file.stream) as img:
+            img.verify()
+        uploaded_file.stream.seek(0)
+    except Exception as e:
+        current_app.logger.error(f"Invalid image upload: {str(e)}")
+        return False, None, "Invalid image file"
+    
     try:
         # Generate unique filename
         filename = generate_unique_filename(uploaded_file.filename)
@@ -112,15 +211,12 @@ def save_portfolio_image(uploaded_file):
         upload_path = os.path.join(current_app.root_path, 'static', 'images', 'portfolio')
         os.makedirs(upload_path, exist_ok=True)
         
-        # Save file
+        # Decode straight from the upload stream; only the optimized image is written
         file_path = os.path.join(upload_path, filename)
-        uploaded_file.save(file_path)
-        
-        # Process and optimize image
-        if resize_and_optimize_image(file_path):
+        if resize_and_optimize_image(file_path, source=uploaded_file.stream):
             return True, filename, None
         else:
-            # Remove file if processing failed
+            # Remove any partly written file if processing failed
             try:
                 os.remove(file_path)
             except:
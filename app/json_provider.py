@@ -0,0 +1,49 @@
+"""
+Fast JSON provider for API responses, backed by orjson when it is installed.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+# orjson is optional; Flask's default (stdlib json) provider is used without it
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson instead of the stdlib json module.
+
+    Output matches Flask's default provider: keys are sorted, and dates, UUIDs,
+    dataclasses and decimals still go through DefaultJSONProvider.default so they
+    are encoded the same way.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """Serialize data as a JSON string.
+
+        Args:
+            obj: The data to serialize
+            **kwargs: Only sort_keys and indent are honoured (orjson has no other options)
+
+        Returns:
+            str: JSON-encoded data
+        """
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize data from a JSON string or bytes.
+
+        Args:
+            s (str or bytes): JSON-encoded data
+
+        Returns:
+            The decoded data
+        """
+        return orjson.loads(s)
@@ -2,12 +2,46 @@
 Database models for the hacker terminal personal brand page.
 """
 
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from slugify import slugify
+from sqlalchemy import event, or_, text, column, Integer, insert, func, bindparam, true
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm.attributes import set_committed_value, get_history, PASSIVE_NO_INITIALIZE
 from app import db
+import atexit
+import logging
+import re
+import threading
+import time
+
+# Module logger; handlers and levels are left to the application's logging config
+logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=1024)
+def make_slug(text):
+    """Slugify text, memoized since the same tag names and titles recur."""
+    return slugify(text)
+
+_WORD_RE = re.compile(r'\S+')
+
+def count_words(text):
+    """Count the whitespace-separated words in text without building a word list."""
+    return sum(1 for _ in _WORD_RE.finditer(text)) if text else 0
+
+# Post views are counted in memory and written in batches: every
+# VIEW_FLUSH_INTERVAL seconds by a background flusher (and at exit), or sooner
+# once VIEW_FLUSH_THRESHOLD views are pending
+VIEW_FLUSH_INTERVAL = 60
+VIEW_FLUSH_THRESHOLD = 100
+_pending_views = Counter()
+_pending_views_lock = threading.Lock()
+_last_view_flush = time.monotonic()
+_view_flusher_started = False
 
 class User(UserMixin, db.Model):
     """User model for authentication and blog management."""
@@ -66,12 +100,22 @@ class BlogPost(db.Model):
     
     # Analytics
     view_count = db.Column(db.Integer, default=0)
+    # Kept in sync with content on write (see _set_word_count) for reading_time
+    word_count = db.Column(db.Integer)
     
     # Foreign keys
     author_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
     
     # Relationships
-    tags = db.relationship('Tag', secondary='post_tags', backref='posts', lazy='dynamic')
+    # Tags are shown wherever posts are listed, so load them for all posts in
+    # a query with one extra SELECT ... IN rather than one query per post
+    tags = db.relationship('Tag', secondary='post_tags', backref='posts', lazy='selectin')
+    
+    __table_args__ = (
+        # Published listings (blog index, API, feed, sitemap) filter on
+        # is_published and order by published_at
+        db.Index('ix_blog_posts_is_published_published_at', 'is_published', 'published_at'),
+    )
     
     def __init__(self, **kwargs):
         super(BlogPost, self).__init__(**kwargs)
@@ -84,13 +128,18 @@ class BlogPost(db.Model):
         """Generate a unique URL-friendly slug from the blog post title.
         
         Creates a slugified version of the title and ensures uniqueness by
-        appending a counter if a post with the same slug already exists.
+        appending a counter if a post with the same slug already exists. All
+        slugs sharing the prefix are fetched in one query and the first free
+        counter is picked in Python.
         """
-        base_slug = slugify(self.title)
+        base_slug = make_slug(self.title)
+        existing = set(db.session.scalars(
+            db.select(BlogPost.slug).where(BlogPost.slug.startswith(base_slug, autoescape=True))
+        ))
         slug = base_slug
         counter = 1
         
-        while BlogPost.query.filter_by(slug=slug).first():
+        while slug in existing:
             slug = f"{base_slug}-{counter}"
             counter += 1
         
@@ -120,26 +169,198 @@ class BlogPost(db.Model):
         self.published_at = None
     
     def increment_views(self):
-        """Increment the view count."""
-        self.view_count += 1
-        db.session.commit()
+        """Increment the view count.
+        
+        The view is buffered and written by flush_pending_views, so a page view
+        doesn't cost its own UPDATE and commit. This instance's count is bumped
+        in memory so the page shows the new total.
+        """
+        with _pending_views_lock:
+            _pending_views[self.id] += 1
+            flush_due = (sum(_pending_views.values()) >= VIEW_FLUSH_THRESHOLD or
+                         time.monotonic() - _last_view_flush >= VIEW_FLUSH_INTERVAL)
+        
+        set_committed_value(self, 'view_count', (self.view_count or 0) + 1)
+        
+        if flush_due:
+            flush_pending_views()
     
     @property
     def reading_time(self):
         """Calculate estimated reading time based on average reading speed.
         
-        Uses the standard assumption of 200 words per minute reading speed.
+        Uses the standard assumption of 200 words per minute reading speed and
+        the stored word count, so listings don't need to load or split content.
+        Posts saved before word_count existed fall back to counting content.
         
         Returns:
             int: Estimated reading time in minutes (minimum 1 minute)
         """
         words_per_minute = 200
-        word_count = len(self.content.split())
+        word_count = self.word_count
+        if word_count is None:
+            word_count = count_words(self.content)
         return max(1, round(word_count / words_per_minute))
     
+    @classmethod
+    def search_filter(cls, search_query):
+        """Build a filter criterion matching posts against a search query.
+        
+        Uses the full-text index created by create_blog_search_index() on
+        SQLite (FTS5) and PostgreSQL (tsvector), and falls back to LIKE
+        matching on other databases.
+        
+        Args:
+            search_query (str): Raw search text entered by the visitor
+            
+        Returns:
+            SQLAlchemy filter criterion
+        """
+        dialect = db.session.get_bind().dialect.name
+        
+        # A query with no terms matches everything (an empty FTS5 MATCH is a syntax error)
+        if not search_query or not search_query.split():
+            return true()
+        
+        if dialect == 'sqlite':
+            # Quote each term so FTS5 operators in user input are treated
+            # literally, and prefix-match to stay close to substring search
+            terms = ' '.join('"' + term.replace('"', '""') + '"*' for term in search_query.split())
+            matches = text("SELECT rowid FROM blog_posts_fts WHERE blog_posts_fts MATCH :terms")
+            return cls.id.in_(matches.bindparams(terms=terms).columns(column('rowid', Integer)))
+        
+        if dialect == 'postgresql':
+            return text("blog_posts.search_vector @@ plainto_tsquery('english', :terms)").bindparams(terms=search_query)
+        
+        return or_(
+            cls.title.contains(search_query),
+            cls.content.contains(search_query),
+            cls.excerpt.contains(search_query)
+        )
+    
     def __repr__(self):
         return f'<BlogPost {self.title}>'
 
+def flush_pending_views():
+    """Write the buffered post views to the database.
+    
+    Every post's pending views are added in one executemany of an atomic
+    ``view_count = view_count + n`` UPDATE, so concurrent writers (other
+    workers flushing their own buffers) don't overwrite each other. Runs on
+    its own connection so the caller's session is left untouched.
+    
+    If the write fails (e.g. SQLite reports the database is locked) the views
+    are put back in the buffer for the next flush and the error is logged
+    rather than raised, so a page view never fails because of it.
+    """
+    global _last_view_flush
+    
+    with _pending_views_lock:
+        pending = dict(_pending_views)
+        _pending_views.clear()
+        _last_view_flush = time.monotonic()
+    
+    if not pending:
+        return
+    
+    posts = BlogPost.__table__
+    stmt = (
+        posts.update()
+        .where(posts.c.id == bindparam('post_id'))
+        # updated_at is pinned so its onupdate doesn't treat a view as an edit
+        .values(view_count=func.coalesce(posts.c.view_count, 0) + bindparam('views'),
+                updated_at=posts.c.updated_at)
+    )
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(stmt, [{'post_id': post_id, 'views': views} for post_id, views in pending.items()])
+    except Exception as e:
+        with _pending_views_lock:
+            _pending_views.update(pending)
+        logger.error("Failed to flush %d buffered post views: %s", sum(pending.values()), e)
+
+def start_view_flusher(app):
+    """Flush buffered post views every VIEW_FLUSH_INTERVAL seconds and at exit.
+    
+    Without this, views buffered by the last visitors before a quiet spell or
+    a restart would wait for more traffic, or be lost. The buffer is
+    per process, so only the first app created in the process starts a flusher.
+    
+    Args:
+        app: Flask application whose database the views are written to
+    """
+    global _view_flusher_started
+    
+    with _pending_views_lock:
+        if _view_flusher_started:
+            return
+        _view_flusher_started = True
+    
+    def flush():
+        with app.app_context():
+            flush_pending_views()
+    
+    def run():
+        while True:
+            time.sleep(VIEW_FLUSH_INTERVAL)
+            if _pending_views:
+                flush()
+    
+    threading.Thread(target=run, name='view-flush', daemon=True).start()
+    atexit.register(flush)
+
+# Full-text search index for blog posts. SQLite uses an external-content FTS5
+# table kept in sync by triggers (the update trigger only watches the indexed
+# columns so view count bumps don't reindex); PostgreSQL uses a generated
+# tsvector column with a GIN index.
+BLOG_SEARCH_DDL = {
+    'sqlite': [
+        """CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_fts
+           USING fts5(title, excerpt, content, content='blog_posts', content_rowid='id')""",
+        """CREATE TRIGGER IF NOT EXISTS blog_posts_fts_insert AFTER INSERT ON blog_posts BEGIN
+               INSERT INTO blog_posts_fts(rowid, title, excerpt, content)
+               VALUES (new.id, new.title, new.excerpt, new.content);
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS blog_posts_fts_delete AFTER DELETE ON blog_posts BEGIN
+               INSERT INTO blog_posts_fts(blog_posts_fts, rowid, title, excerpt, content)
+               VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+           END""",
+        """CREATE TRIGGER IF NOT EXISTS blog_posts_fts_update AFTER UPDATE OF title, excerpt, content ON blog_posts BEGIN
+               INSERT INTO blog_posts_fts(blog_posts_fts, rowid, title, excerpt, content)
+               VALUES ('delete', old.id, old.title, old.excerpt, old.content);
+               INSERT INTO blog_posts_fts(rowid, title, excerpt, content)
+               VALUES (new.id, new.title, new.excerpt, new.content);
+           END""",
+        "INSERT INTO blog_posts_fts(blog_posts_fts) VALUES ('rebuild')",
+    ],
+    'postgresql': [
+        """ALTER TABLE blog_posts ADD COLUMN IF NOT EXISTS search_vector tsvector
+           GENERATED ALWAYS AS (to_tsvector('english',
+               coalesce(title, '') || ' ' || coalesce(excerpt, '') || ' ' || coalesce(content, ''))) STORED""",
+        "CREATE INDEX IF NOT EXISTS ix_blog_posts_search_vector ON blog_posts USING GIN (search_vector)",
+    ],
+}
+
+def create_blog_search_index(connection):
+    """Create (or rebuild) the blog full-text search index for the connection's database."""
+    for statement in BLOG_SEARCH_DDL.get(connection.dialect.name, []):
+        connection.execute(text(statement))
+
+@event.listens_for(BlogPost, 'before_insert')
+def _set_word_count(mapper, connection, target):
+    """Count a new post's words."""
+    target.word_count = count_words(target.content)
+
+@event.listens_for(BlogPost, 'before_update')
+def _update_word_count(mapper, connection, target):
+    """Recount a post's words when its content changes."""
+    if get_history(target, 'content', passive=PASSIVE_NO_INITIALIZE).has_changes():
+        _set_word_count(mapper, connection, target)
+
+@event.listens_for(BlogPost.__table__, 'after_create')
+def _create_blog_search_index(target, connection, **kw):
+    create_blog_search_index(connection)
+
 class Tag(db.Model):
     """Tag model for categorizing blog posts."""
     
@@ -154,11 +375,42 @@ class Tag(db.Model):
     def __init__(self, **kwargs):
         super(Tag, self).__init__(**kwargs)
         if not self.slug and self.name:
-            self.slug = slugify(self.name)
+            self.slug = make_slug(self.name)
+    
+    @classmethod
+    def insert_missing(cls, names):
+        """Insert tags for the given names in one statement, skipping existing ones.
+        
+        Uniqueness is enforced by the database, so concurrent requests adding
+        the same tag don't race into an IntegrityError.
+        
+        Args:
+            names (iterable): Tag names to ensure exist
+        """
+        rows = [{'name': name, 'slug': make_slug(name)} for name in names]
+        if rows:
+            db.session.execute(insert_ignore(cls).values(rows))
     
     def __repr__(self):
         return f'<Tag {self.name}>'
 
+def insert_ignore(model):
+    """Build an INSERT for the model that skips rows violating a unique constraint.
+    
+    Args:
+        model: SQLAlchemy model class to insert into
+        
+    Returns:
+        Insert statement using ON CONFLICT DO NOTHING (PostgreSQL/SQLite)
+        or INSERT IGNORE (MySQL)
+    """
+    dialect = db.session.get_bind().dialect.name
+    if dialect == 'postgresql':
+        return postgresql.insert(model).on_conflict_do_nothing()
+    if dialect == 'sqlite':
+        return sqlite.insert(model).on_conflict_do_nothing()
+    return insert(model).prefix_with('IGNORE')
+
 # Association table for many-to-many relationship between posts and tags
 post_tags = db.Table('post_tags',
     db.Column('post_id', db.Integer, db.ForeignKey('blog_posts.id'), primary_key=True),
@@ -179,7 +431,7 @@ class PortfolioItem(db.Model):
     image_filename = db.Column(db.String(255))
     technologies = db.Column(db.String(255))  # Comma-separated list
     status = db.Column(db.String(20), default='live')  # live, development, archived
-    sort_order = db.Column(db.Integer, default=0)
+    sort_order = db.Column(db.Integer, default=0, index=True)
     is_featured = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -243,6 +495,12 @@ class ContactMessage(db.Model):
     is_read = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     
+    __table_args__ = (
+        # Partial index backing the dashboard's unread message count
+        db.Index('ix_contact_messages_unread_created_at', 'created_at',
+                 postgresql_where=is_read.is_(False), sqlite_where=is_read.is_(False)),
+    )
+    
     def mark_as_read(self):
         """Mark the message as read."""
         self.is_read = True
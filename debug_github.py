@@ -13,6 +13,8 @@ Usage: python debug_github.py
 
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from dotenv import load_dotenv
 
@@ -29,6 +31,12 @@ def debug_github_api():
     print("🔍 GitHub API Debug")
     print("=" * 50)
     
+    # One session for every call below so the connection to api.github.com is reused
+    session = requests.Session()
+    session.headers['Accept'] = 'application/vnd.github+json'
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=('GET',))
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    
     # Check environment variables
     github_url = os.environ.get('GITHUB_URL', '')
     print(f"📝 GITHUB_URL from .env: {github_url}")
@@ -49,7 +57,7 @@ def debug_github_api():
         user_url = f"https://api.github.com/users/{username}"
         print(f"📡 Calling: {user_url}")
         
-        response = requests.get(user_url, timeout=10)
+        response = session.get(user_url, timeout=10)
         print(f"📊 Response status: {response.status_code}")
         
         if response.status_code == 200:
@@ -82,7 +90,7 @@ def debug_github_api():
         repos_url = f"https://api.github.com/users/{username}/repos"
         params = {'type': 'owner', 'sort': 'updated', 'per_page': 5}
         
-        response = requests.get(repos_url, params=params, timeout=10)
+        response = session.get(repos_url, params=params, timeout=10)
         print(f"📊 Repos API status: {response.status_code}")
         
         if response.status_code == 200:
@@ -107,8 +115,8 @@ def debug_github_api():
     
     try:
         # Get first repo for testing
-        repos_response = requests.get(f"https://api.github.com/users/{username}/repos", 
-                                    params={'type': 'owner', 'per_page': 1}, timeout=10)
+        repos_response = session.get(f"https://api.github.com/users/{username}/repos", 
+                                   params={'type': 'owner', 'per_page': 1}, timeout=10)
         
         if repos_response.status_code == 200 and repos_response.json():
             test_repo = repos_response.json()[0]
@@ -123,7 +131,7 @@ def debug_github_api():
             params = {'author': username, 'since': since, 'per_page': 10}
             
             print(f"📡 Testing commits API on: {repo_name}")
-            response = requests.get(commits_url, params=params, timeout=10)
+            response = session.get(commits_url, params=params, timeout=10)
             print(f"📊 Commits API status: {response.status_code}")
             
             if response.status_code == 200:
@@ -150,7 +158,7 @@ def debug_github_api():
     print(f"\n⏰ Checking rate limits...")
     try:
         rate_limit_url = "https://api.github.com/rate_limit"
-        response = requests.get(rate_limit_url, timeout=10)
+        response = session.get(rate_limit_url, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
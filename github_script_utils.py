@@ -0,0 +1,131 @@
+"""
+Shared helpers for the GitHub command-line scripts (setup_github_token.py,
+test_github_quick.py): a pooled API session, an ETag cache for GET requests
+and the username from GITHUB_URL.
+"""
+
+import atexit
+import json
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
+from urllib.parse import urlencode
+
+# Shared by every call (and worker thread) so connections to the API are kept alive
+session = requests.Session()
+session.headers['Accept'] = 'application/vnd.github.v3+json'
+session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+))
+atexit.register(session.close)
+
+# ETag cache for GET requests, kept between runs in the user's cache directory
+# (not the repository) and readable only by the user
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'terminal-portfolio')
+CACHE_FILE = os.path.join(CACHE_DIR, 'github_cache.json')
+_cache_lock = threading.Lock()
+_cache_changed = False
+
+# The only fields the scripts read; everything else is dropped before caching
+REPO_FIELDS = ('name', 'full_name', 'private', 'pushed_at')
+
+def _load_cache():
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+_response_cache = _load_cache()
+
+@atexit.register
+def _save_cache():
+    if _cache_changed:
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        fd = os.open(CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(_response_cache, f)
+
+def _slim(body):
+    """Reduce a repository or commit list to the fields the scripts use."""
+    if not isinstance(body, list):
+        return body
+    items = []
+    for item in body:
+        if 'commit' in item:
+            commit = item['commit']
+            items.append({'commit': {'message': commit['message'], 'author': {'date': commit['author']['date']}}})
+        else:
+            items.append({field: item.get(field) for field in REPO_FIELDS})
+    return items
+
+def cached_get(url, params=None, headers=None):
+    """GET a GitHub API URL, revalidating any cached copy with its ETag.
+    
+    GitHub doesn't count 304 Not Modified responses against the rate limit,
+    so repeat runs only pay for data that changed. Repository and commit
+    lists are trimmed to the fields the scripts use, cached or not.
+    
+    Returns:
+        tuple: (status code, decoded JSON body or None if the request failed)
+    """
+    global _cache_changed
+    key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+    if headers and 'Authorization' in headers:
+        key = f"token:{key}"
+    
+    with _cache_lock:
+        cached = _response_cache.get(key)
+    request_headers = dict(headers or {})
+    if cached:
+        request_headers['If-None-Match'] = cached['etag']
+    
+    response = session.get(url, params=params, headers=request_headers, timeout=10)
+    if response.status_code == 304 and cached:
+        return 200, cached['body']
+    if response.status_code != 200:
+        return response.status_code, None
+    
+    body = _slim(response.json())
+    if response.headers.get('ETag'):
+        with _cache_lock:
+            _response_cache[key] = {'etag': response.headers['ETag'], 'body': body}
+            _cache_changed = True
+    return 200, body
+
+def cached_get_all(url, params, headers=None):
+    """GET every page of a paginated GitHub API list.
+    
+    Pages are requested by number until one comes back short, so each page
+    keeps its own ETag cache entry.
+    
+    Returns:
+        tuple: (status code, combined list of items or None if a page failed)
+    """
+    items = []
+    page = 1
+    while True:
+        status, body = cached_get(url, params={**params, 'page': page}, headers=headers)
+        if status != 200:
+            return status, None
+        items.extend(body)
+        if len(body) < params['per_page']:
+            return 200, items
+        page += 1
+
+@lru_cache(maxsize=1)
+def github_username():
+    """Extract the GitHub username from GITHUB_URL (parsed once per run).
+    
+    Returns:
+        str: The username, or None if GITHUB_URL isn't a GitHub profile URL
+    """
+    github_url = os.environ.get('GITHUB_URL', '')
+    if 'github.com/' in github_url:
+        return github_url.split('github.com/')[-1].rstrip('/')
+    return None
@@ -25,16 +25,14 @@ from sqlalchemy import text
 
 def get_migration_files():
     """Get all migration files sorted by number."""
-    migrations_dir = Path("migrations")
-    migration_files = []
-    
-    for file in migrations_dir.glob("migration_*.py"):
-        if file.name != "__init__.py":
-            migration_files.append(file)
-    
-    # Sort by migration number
-    migration_files.sort(key=lambda x: x.stem.split('_')[1])
-    return migration_files
+    migration_files = [
+        entry for entry in os.scandir("migrations")
+        if entry.is_file() and entry.name.startswith("migration_") and entry.name.endswith(".py")
+    ]
+    
+    # Sort by migration number (numerically, so 010 comes after 009)
+    migration_files.sort(key=lambda entry: int(entry.name.split('_', 2)[1]))
+    return [Path(entry.path) for entry in migration_files]
 
 def run_migration(migration_file, rollback=False):
     """Run a specific migration file."""
@@ -60,55 +58,72 @@ def run_migration(migration_file, rollback=False):
             print("❌ No upgrade function found in migration")
 
 def create_migrations_table():
-    """Create a table to track applied migrations."""
-    app = create_app()
-    
-    with app.app_context():
-        try:
-            with db.engine.connect() as connection:
-                connection.execute(text("""
-                    CREATE TABLE IF NOT EXISTS schema_migrations (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        migration_name VARCHAR(255) NOT NULL UNIQUE,
-                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """))
-                connection.commit()
-            print("✅ Schema migrations table ready")
-        except Exception as e:
-            print(f"❌ Failed to create migrations table: {e}")
-
-def mark_migration_applied(migration_name):
-    """Mark a migration as applied."""
-    app = create_app()
-    
-    with app.app_context():
-        try:
-            with db.engine.connect() as connection:
-                connection.execute(
-                    text("INSERT OR IGNORE INTO schema_migrations (migration_name) VALUES (:name)"), 
-                    {"name": migration_name}
+    """Create any missing model tables and a table to track applied migrations.
+
+    Must be called inside an app context.
+    """
+    try:
+        # Base schema for fresh databases (existing tables are left alone)
+        db.create_all()
+        
+        with db.engine.begin() as connection:
+            connection.execute(text("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    migration_name VARCHAR(255) NOT NULL UNIQUE,
+                    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
-                connection.commit()
-            print(f"📝 Marked {migration_name} as applied")
-        except Exception as e:
-            print(f"⚠️  Could not mark migration as applied: {e}")
+            """))
+        print("✅ Schema migrations table ready")
+    except Exception as e:
+        print(f"❌ Failed to create migrations table: {e}")
 
-def is_migration_applied(migration_name):
-    """Check if a migration has been applied."""
-    app = create_app()
-    
-    with app.app_context():
-        try:
-            with db.engine.connect() as connection:
-                result = connection.execute(
-                    text("SELECT COUNT(*) as count FROM schema_migrations WHERE migration_name = :name"), 
-                    {"name": migration_name}
-                ).fetchone()
-                return result.count > 0
-        except:
-            # If table doesn't exist, no migrations have been applied
-            return False
+def get_applied_migrations():
+    """Load the names of all applied migrations in one query.
+
+    Returns:
+        set: Names of the migrations recorded in schema_migrations
+    """
+    try:
+        with db.engine.connect() as connection:
+            result = connection.execute(text("SELECT migration_name FROM schema_migrations"))
+            return {row[0] for row in result}
+    except Exception:
+        # If table doesn't exist, no migrations have been applied
+        return set()
+
+def mark_migration_applied(migration_name, applied):
+    """Mark a migration as applied.
+
+    Args:
+        migration_name (str): Name of the migration file (without extension)
+        applied (set): Applied migration names, updated in place
+    """
+    try:
+        with db.engine.begin() as connection:
+            connection.execute(
+                text("INSERT OR IGNORE INTO schema_migrations (migration_name) VALUES (:name)"), 
+                {"name": migration_name}
+            )
+        applied.add(migration_name)
+        print(f"📝 Marked {migration_name} as applied")
+    except Exception as e:
+        print(f"⚠️  Could not mark migration as applied: {e}")
+
+def optimize_database():
+    """Refresh SQLite's query planner statistics after schema changes.
+
+    PRAGMA optimize only re-analyzes tables whose statistics it considers
+    stale, so it is cheap when nothing changed. Other databases are left
+    to their own autovacuum/analyze.
+    """
+    if db.engine.dialect.name != 'sqlite':
+        return
+    try:
+        with db.engine.connect() as connection:
+            connection.execute(text("PRAGMA optimize"))
+    except Exception as e:
+        print(f"⚠️  Could not optimize database: {e}")
 
 def main():
     import argparse
@@ -124,15 +139,29 @@ def main():
     print("🔧 Terminal Portfolio Migration Runner")
     print("=" * 50)
     
+    # One app and app context for the whole run; the engine's pool hands the
+    # same connection back to each query below
+    app = create_app()
+    
+    with app.app_context():
+        run(args)
+
+def run(args):
+    """Run the migration command selected on the command line.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+    """
     # Create migrations tracking table
     create_migrations_table()
+    applied = get_applied_migrations()
     
     migration_files = get_migration_files()
     
     if args.list:
         print("\n📋 Available Migrations:")
         for migration_file in migration_files:
-            status = "✅ Applied" if is_migration_applied(migration_file.stem) else "⏳ Pending"
+            status = "✅ Applied" if migration_file.stem in applied else "⏳ Pending"
             print(f"  {migration_file.stem} - {status}")
         return
     
@@ -145,10 +174,11 @@ def main():
                 break
         
         if target_migration:
-            if args.force or not is_migration_applied(target_migration.stem):
+            if args.force or target_migration.stem not in applied:
                 run_migration(target_migration, rollback=args.rollback)
                 if not args.rollback:
-                    mark_migration_applied(target_migration.stem)
+                    mark_migration_applied(target_migration.stem, applied)
+                optimize_database()
             else:
                 print(f"⚠️  Migration {target_migration.stem} already applied. Use --force to run anyway.")
         else:
@@ -167,9 +197,9 @@ def main():
     pending_count = 0
     
     for migration_file in migration_files:
-        if not is_migration_applied(migration_file.stem) or args.force:
+        if migration_file.stem not in applied or args.force:
             run_migration(migration_file)
-            mark_migration_applied(migration_file.stem)
+            mark_migration_applied(migration_file.stem, applied)
             pending_count += 1
         else:
             print(f"⏭️  Skipping {migration_file.stem} (already applied)")
@@ -177,6 +207,7 @@ def main():
     if pending_count == 0:
         print("✅ No pending migrations found. Database is up to date!")
     else:
+        optimize_database()
         print(f"🎉 Successfully applied {pending_count} migration(s)!")
 
 if __name__ == "__main__":
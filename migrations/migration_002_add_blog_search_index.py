@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Migration 002: Add full-text search index for blog posts
+
+This migration creates the full-text search index used by the blog search:
+- SQLite: an FTS5 table (blog_posts_fts) kept in sync with blog_posts by triggers
+- PostgreSQL: a generated search_vector column with a GIN index
+
+New databases get the index automatically from db.create_all(); this
+migration adds it to existing databases and indexes the posts already there.
+
+Run with: python migrations/migration_002_add_blog_search_index.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.models import create_blog_search_index
+from sqlalchemy import text
+
+def upgrade():
+    """Create the blog full-text search index and index existing posts."""
+    print("🔄 Running Migration 002: Add blog full-text search index")
+
+    app = create_app()
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                create_blog_search_index(connection)
+
+                # Commit the transaction
+                connection.commit()
+
+            print(f"✅ Successfully created blog search index ({db.engine.dialect.name})")
+
+        except Exception as e:
+            print(f"❌ Migration failed: {str(e)}")
+            raise
+
+def downgrade():
+    """Remove the blog full-text search index."""
+    print("🔄 Rolling back Migration 002: Remove blog full-text search index")
+
+    app = create_app()
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                if connection.dialect.name == 'sqlite':
+                    for trigger in ('blog_posts_fts_insert', 'blog_posts_fts_delete', 'blog_posts_fts_update'):
+                        connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+                    connection.execute(text("DROP TABLE IF EXISTS blog_posts_fts"))
+                elif connection.dialect.name == 'postgresql':
+                    connection.execute(text("DROP INDEX IF EXISTS ix_blog_posts_search_vector"))
+                    connection.execute(text("ALTER TABLE blog_posts DROP COLUMN IF EXISTS search_vector"))
+
+                connection.commit()
+
+            print("✅ Successfully removed blog search index")
+
+        except Exception as e:
+            print(f"❌ Rollback failed: {str(e)}")
+            raise
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Blog Search Index Migration')
+    parser.add_argument('--rollback', action='store_true', help='Rollback the migration')
+
+    args = parser.parse_args()
+
+    if args.rollback:
+        downgrade()
+    else:
+        upgrade()
+
+    print("🎉 Migration completed successfully!")
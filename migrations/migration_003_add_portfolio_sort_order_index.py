@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Migration 003: Add index on portfolio_items.sort_order
+
+The admin and public portfolio lists are ordered (and paginated) by
+sort_order, so index it to avoid sorting the whole table per request.
+
+Run with: python migrations/migration_003_add_portfolio_sort_order_index.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from sqlalchemy import text
+
+def upgrade():
+    """Create the sort_order index on portfolio_items."""
+    print("🔄 Running Migration 003: Add portfolio sort_order index")
+    
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                connection.execute(text("""
+                    CREATE INDEX IF NOT EXISTS ix_portfolio_items_sort_order
+                    ON portfolio_items (sort_order)
+                """))
+                
+                # Commit the transaction
+                connection.commit()
+            
+            print("✅ Successfully created index 'ix_portfolio_items_sort_order'")
+            
+        except Exception as e:
+            print(f"❌ Migration failed: {str(e)}")
+            raise
+
+def downgrade():
+    """Drop the sort_order index on portfolio_items."""
+    print("🔄 Rolling back Migration 003: Remove portfolio sort_order index")
+    
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                connection.execute(text("DROP INDEX IF EXISTS ix_portfolio_items_sort_order"))
+                connection.commit()
+            
+            print("✅ Successfully dropped index 'ix_portfolio_items_sort_order'")
+            
+        except Exception as e:
+            print(f"❌ Rollback failed: {str(e)}")
+            raise
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Portfolio Sort Order Index Migration')
+    parser.add_argument('--rollback', action='store_true', help='Rollback the migration')
+    
+    args = parser.parse_args()
+    
+    if args.rollback:
+        downgrade()
+    else:
+        upgrade()
+        
+    print("🎉 Migration completed successfully!")
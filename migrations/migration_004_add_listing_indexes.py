@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Migration 004: Add indexes for published post listings and unread messages
+
+Adds indexes matching the hottest query predicates:
+- blog_posts (is_published, published_at): blog index, API, feed and sitemap
+- contact_messages (created_at) WHERE NOT is_read: dashboard unread count
+  (partial index on SQLite/PostgreSQL)
+
+Run with: python migrations/migration_004_add_listing_indexes.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.models import BlogPost, ContactMessage
+from sqlalchemy import text
+
+INDEX_NAMES = {
+    BlogPost.__table__: 'ix_blog_posts_is_published_published_at',
+    ContactMessage.__table__: 'ix_contact_messages_unread_created_at',
+}
+
+def get_indexes():
+    """Get the Index objects declared on the models for this migration."""
+    return [index for table, name in INDEX_NAMES.items()
+            for index in table.indexes if index.name == name]
+
+def upgrade():
+    """Create the listing indexes."""
+    print("🔄 Running Migration 004: Add listing indexes")
+    
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                # Built from the model definitions so partial index
+                # predicates match the SQL the queries emit
+                for index in get_indexes():
+                    index.create(connection, checkfirst=True)
+                    print(f"✅ Created index '{index.name}'")
+                
+                # Commit the transaction
+                connection.commit()
+            
+        except Exception as e:
+            print(f"❌ Migration failed: {str(e)}")
+            raise
+
+def downgrade():
+    """Drop the listing indexes."""
+    print("🔄 Rolling back Migration 004: Remove listing indexes")
+    
+    app = create_app()
+    
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                for name in INDEX_NAMES.values():
+                    connection.execute(text(f"DROP INDEX IF EXISTS {name}"))
+                connection.commit()
+            
+            print("✅ Successfully dropped listing indexes")
+            
+        except Exception as e:
+            print(f"❌ Rollback failed: {str(e)}")
+            raise
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Listing Indexes Migration')
+    parser.add_argument('--rollback', action='store_true', help='Rollback the migration')
+    
+    args = parser.parse_args()
+    
+    if args.rollback:
+        downgrade()
+    else:
+        upgrade()
+        
+    print("🎉 Migration completed successfully!")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Migration 005: Add word_count column to blog_posts table
+
+This migration adds a word_count column that stores each post's word count,
+so reading time estimates don't have to split the full post content on every
+render, and fills it in for the posts already there.
+
+Run with: python migrations/migration_005_add_blog_word_count.py
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app import create_app, db
+from app.models import count_words
+from sqlalchemy import text, inspect
+
+def upgrade():
+    """Add word_count column to blog_posts table and count existing posts."""
+    print("🔄 Running Migration 005: Add word_count column")
+
+    app = create_app()
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                # Check if column already exists
+                columns = [column['name'] for column in inspect(connection).get_columns('blog_posts')]
+
+                if 'word_count' not in columns:
+                    connection.execute(text("ALTER TABLE blog_posts ADD COLUMN word_count INTEGER"))
+                    print("✅ Added 'word_count' column to blog_posts table")
+                else:
+                    print("✅ Column 'word_count' already exists")
+
+                # Count words for posts saved before the column existed
+                posts = connection.execute(text(
+                    "SELECT id, content FROM blog_posts WHERE word_count IS NULL"
+                )).fetchall()
+
+                if posts:
+                    connection.execute(
+                        text("UPDATE blog_posts SET word_count = :word_count WHERE id = :id"),
+                        [{'id': post.id, 'word_count': count_words(post.content)} for post in posts]
+                    )
+
+                # Commit the transaction
+                connection.commit()
+
+            print(f"✅ Counted words for {len(posts)} existing posts")
+
+        except Exception as e:
+            print(f"❌ Migration failed: {str(e)}")
+            raise
+
+def downgrade():
+    """Remove word_count column from blog_posts table."""
+    print("🔄 Rolling back Migration 005: Remove word_count column")
+
+    app = create_app()
+
+    with app.app_context():
+        try:
+            with db.engine.connect() as connection:
+                connection.execute(text("ALTER TABLE blog_posts DROP COLUMN word_count"))
+                connection.commit()
+
+            print("✅ Successfully removed 'word_count' column")
+
+        except Exception as e:
+            print(f"❌ Rollback failed: {str(e)}")
+            raise
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Blog Word Count Migration')
+    parser.add_argument('--rollback', action='store_true', help='Rollback the migration')
+
+    args = parser.parse_args()
+
+    if args.rollback:
+        downgrade()
+    else:
+        upgrade()
+
+    print("🎉 Migration completed successfully!")
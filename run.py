@@ -4,12 +4,25 @@ Main application entry point for the hacker terminal personal brand page.
 Run with: python run.py
 """
 
+import atexit
 import os
+from sqlalchemy import text, select, insert
 from app import create_app, db
 from app.models import User, BlogPost, PortfolioItem
 
 app = create_app()
 
+def optimize_sqlite():
+    """Refresh SQLite's query planner statistics (no-op on other databases).
+    
+    Runs on its own connection; PRAGMA optimize only re-analyzes tables
+    whose statistics look stale, so it is cheap when little has changed.
+    """
+    with app.app_context():
+        if db.engine.dialect.name == 'sqlite':
+            with db.engine.connect() as connection:
+                connection.execute(text("PRAGMA optimize"))
+
 @app.shell_context_processor
 def make_shell_context():
     """Make database models available in Flask shell."""
@@ -25,6 +38,9 @@ def init_db():
     """Initialize the database with sample data."""
     db.create_all()
     
+    # New objects are collected and added to the session together at the end
+    to_add = []
+    
     # Create admin user if it doesn't exist
     admin = User.query.filter_by(username='admin').first()
     if not admin:
@@ -42,7 +58,7 @@ def init_db():
             print("   Set ADMIN_PASSWORD environment variable in production")
             print("   Example: export ADMIN_PASSWORD='your-secure-password'")
             print("   Or change it in the admin panel after first login")
-        db.session.add(admin)
+        to_add.append(admin)
     
     # Add portfolio items
     portfolio_items = [
@@ -69,11 +85,13 @@ def init_db():
         }
     ]
     
-    for item_data in portfolio_items:
-        existing = PortfolioItem.query.filter_by(title=item_data['title']).first()
-        if not existing:
-            item = PortfolioItem(**item_data)
-            db.session.add(item)
+    # One query for the titles already present, then one multi-row insert for the rest
+    existing_titles = set(db.session.execute(
+        select(PortfolioItem.title).where(PortfolioItem.title.in_([item['title'] for item in portfolio_items]))
+    ).scalars())
+    missing_items = [item for item in portfolio_items if item['title'] not in existing_titles]
+    if missing_items:
+        db.session.execute(insert(PortfolioItem), missing_items)
     
     # Add a sample blog post
     sample_post = BlogPost.query.filter_by(title='Welcome to the Terminal').first()
@@ -105,12 +123,21 @@ Stay tuned for more insights from the terminal...
             author_id=1,
             is_published=True
         )
-        db.session.add(post)
+        to_add.append(post)
     
+    db.session.add_all(to_add)
     db.session.commit()
+    
+    # Give SQLite's query planner statistics for the seeded tables and indexes
+    optimize_sqlite()
+    
     print("Database initialized successfully!")
 
 if __name__ == '__main__':
+    # SQLite recommends running optimize before the last connection closes; only
+    # the server does this, not every import of this module (shell, tooling, tests)
+    atexit.register(optimize_sqlite)
+    
     # Enable debug mode for development - disable in production
     debug_mode = os.environ.get('FLASK_DEBUG', 'False').lower() in ['true', '1', 'on']
     app.run(debug=debug_mode, host='0.0.0.0', port=5000)
\ No newline at end of file
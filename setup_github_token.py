@@ -4,51 +4,138 @@ Helper script to test GitHub token and show the difference
 
 import os
 import requests
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+from github_script_utils import session, cached_get_all, github_username
 
 load_dotenv()
 
+USER_ID_QUERY = """
+query($login: String!) {
+  user(login: $login) { id }
+}
+"""
+
+COMMIT_COUNTS_QUERY = """
+query($authorId: ID!, $since: GitTimestamp!, $after: String) {
+  viewer {
+    repositories(first: 100, after: $after, ownerAffiliations: OWNER) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        isPrivate
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(since: $since, author: {id: $authorId}) { totalCount }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+def fetch_commits(repo, headers, username, since):
+    """Fetch a repository's commits by the user since the given time.
+    
+    Returns:
+        tuple: (repo, list of commits, or None if the request failed)
+    """
+    # Nothing pushed since the cutoff means no commits to find (ISO timestamps compare as strings)
+    if repo.get('pushed_at') and repo['pushed_at'] < since:
+        return repo, []
+    
+    commits_url = f"https://api.github.com/repos/{repo['full_name']}/commits"
+    params = {'author': username, 'since': since, 'per_page': 100}
+    
+    status, commits = cached_get_all(commits_url, params, headers=headers)
+    return repo, commits
+
+def fetch_all_commits(repos, headers, username, since):
+    """Fetch commits for every repository concurrently, in repository order."""
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        return list(executor.map(lambda repo: fetch_commits(repo, headers, username, since), repos))
+
+def graphql(headers, query, variables):
+    """Run a query against the GitHub GraphQL API.
+    
+    Returns:
+        dict: The response's data object
+        
+    Raises:
+        requests.RequestException: If the request fails or the query returns errors
+    """
+    response = session.post("https://api.github.com/graphql", headers=headers,
+                            json={'query': query, 'variables': variables}, timeout=10)
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get('errors'):
+        raise requests.RequestException(payload['errors'][0].get('message', 'GraphQL query failed'))
+    return payload['data']
+
+def fetch_commit_counts_graphql(headers, username, since):
+    """Count the user's commits in each of the token owner's repositories.
+    
+    Takes one GraphQL query for the user's node ID (commit history filters
+    authors by ID) and one per 100 repositories for their commit counts.
+    
+    Returns:
+        list: (name, is_private, commit count or None for empty repositories)
+        tuples, or None if the GraphQL API could not be used
+    """
+    try:
+        author_id = graphql(headers, USER_ID_QUERY, {'login': username})['user']['id']
+        
+        repo_counts = []
+        after = None
+        while True:
+            data = graphql(headers, COMMIT_COUNTS_QUERY, {'authorId': author_id, 'since': since, 'after': after})
+            repositories = data['viewer']['repositories']
+            for repo in repositories['nodes']:
+                branch = repo['defaultBranchRef']
+                commit_count = branch['target']['history']['totalCount'] if branch else None
+                repo_counts.append((repo['name'], repo['isPrivate'], commit_count))
+            if not repositories['pageInfo']['hasNextPage']:
+                return repo_counts
+            after = repositories['pageInfo']['endCursor']
+    except (requests.RequestException, KeyError, TypeError) as e:
+        print(f"⚠️  GraphQL unavailable ({e}), counting commits per repository")
+        return None
+
 def test_without_token():
     """Test GitHub API without token (public only)"""
     print("🔓 Testing WITHOUT token (public repos only):")
     print("=" * 50)
     
-    # Extract username from environment
-    github_url = os.environ.get('GITHUB_URL', '')
-    if 'github.com/' in github_url:
-        username = github_url.split('github.com/')[-1].rstrip('/')
-    else:
+    username = github_username()
+    if not username:
         print("❌ Please set GITHUB_URL in your .env file")
         return
-    headers = {'Accept': 'application/vnd.github.v3+json'}
+    headers = {}
     
     # Get repos
     repos_url = f"https://api.github.com/users/{username}/repos"
-    response = requests.get(repos_url, headers=headers, params={'type': 'owner', 'per_page': 100})
+    status, repos = cached_get_all(repos_url, {'type': 'owner', 'per_page': 100}, headers=headers)
     
-    if response.status_code == 200:
-        repos = response.json()
+    if status == 200:
         print(f"📁 Public repositories: {len(repos)}")
         
-        # Count commits from last 30 days
-        thirty_days_ago = datetime.now() - timedelta(days=30)
-        since = thirty_days_ago.isoformat() + 'Z'
+        # Count commits from last 30 days (from midnight, so repeat runs request the same URLs)
+        thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+        since = thirty_days_ago.strftime('%Y-%m-%dT00:00:00Z')
         
         total_commits = 0
-        for repo in repos:
-            commits_url = f"https://api.github.com/repos/{repo['full_name']}/commits"
-            params = {'author': username, 'since': since, 'per_page': 100}
-            
-            commit_response = requests.get(commits_url, headers=headers, params=params)
-            if commit_response.status_code == 200:
-                commits = commit_response.json()
+        for repo, commits in fetch_all_commits(repos, headers, username, since):
+            if commits is not None:
                 total_commits += len(commits)
                 print(f"   - {repo['name']}: {len(commits)} commits")
         
         print(f"📊 Total public commits (30 days): {total_commits}")
     else:
-        print(f"❌ Error: {response.status_code}")
+        print(f"❌ Error: {status}")
 
 def test_with_token():
     """Test GitHub API with token (public + private)"""
@@ -63,62 +150,60 @@ def test_with_token():
     print(f"\n🔑 Testing WITH token (public + private repos):")
     print("=" * 50)
     
-    # Extract username from environment
-    github_url = os.environ.get('GITHUB_URL', '')
-    if 'github.com/' in github_url:
-        username = github_url.split('github.com/')[-1].rstrip('/')
-    else:
+    username = github_username()
+    if not username:
         print("❌ Please set GITHUB_URL in your .env file")
         return
-    headers = {
-        'Accept': 'application/vnd.github.v3+json',
-        'Authorization': f'token {token}'
-    }
+    headers = {'Authorization': f'token {token}'}
     
-    # Get ALL repos (public + private)
-    repos_url = f"https://api.github.com/user/repos"  # Note: different endpoint for authenticated user
-    response = requests.get(repos_url, headers=headers, params={'type': 'owner', 'per_page': 100})
+    # Count commits from last 30 days (from midnight, so repeat runs request the same URLs)
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+    since = thirty_days_ago.strftime('%Y-%m-%dT00:00:00Z')
     
-    if response.status_code == 200:
-        repos = response.json()
-        print(f"📁 Total repositories (public + private): {len(repos)}")
-        
-        # Count commits from last 30 days
-        thirty_days_ago = datetime.now() - timedelta(days=30)
-        since = thirty_days_ago.isoformat() + 'Z'
+    # GraphQL counts every repository's commits in one query; REST needs a call per repository
+    repo_counts = fetch_commit_counts_graphql(headers, username, since)
+    
+    if repo_counts is None:
+        # Get ALL repos (public + private)
+        repos_url = f"https://api.github.com/user/repos"  # Note: different endpoint for authenticated user
+        status, repos = cached_get_all(repos_url, {'type': 'owner', 'per_page': 100}, headers=headers)
         
-        total_commits = 0
-        private_repos = 0
+        if status == 401:
+            print("❌ Invalid token - check your GITHUB_TOKEN")
+            return
+        elif status != 200:
+            print(f"❌ Error: {status}")
+            return
         
-        for repo in repos:
-            if repo['private']:
-                private_repos += 1
-                
-            commits_url = f"https://api.github.com/repos/{repo['full_name']}/commits"
-            params = {'author': username, 'since': since, 'per_page': 100}
+        repo_counts = [
+            (repo['name'], repo['private'], len(commits) if commits is not None else None)
+            for repo, commits in fetch_all_commits(repos, headers, username, since)
+        ]
+    
+    print(f"📁 Total repositories (public + private): {len(repo_counts)}")
+    
+    total_commits = 0
+    private_repos = 0
+    
+    for name, is_private, commit_count in repo_counts:
+        if is_private:
+            private_repos += 1
             
-            commit_response = requests.get(commits_url, headers=headers, params=params)
-            if commit_response.status_code == 200:
-                commits = commit_response.json()
-                total_commits += len(commits)
-                privacy = "🔒" if repo['private'] else "🌍"
-                print(f"   {privacy} {repo['name']}: {len(commits)} commits")
-        
-        print(f"🔒 Private repositories: {private_repos}")
-        print(f"📊 Total commits (30 days): {total_commits}")
-        
-        # Check rate limits
-        rate_limit_url = "https://api.github.com/rate_limit"
-        rate_response = requests.get(rate_limit_url, headers=headers)
-        if rate_response.status_code == 200:
-            rate_data = rate_response.json()
-            core = rate_data['resources']['core']
-            print(f"⏰ API Rate limit: {core['remaining']}/{core['limit']}")
-        
-    elif response.status_code == 401:
-        print("❌ Invalid token - check your GITHUB_TOKEN")
-    else:
-        print(f"❌ Error: {response.status_code}")
+        if commit_count is not None:
+            total_commits += commit_count
+            privacy = "🔒" if is_private else "🌍"
+            print(f"   {privacy} {name}: {commit_count} commits")
+    
+    print(f"🔒 Private repositories: {private_repos}")
+    print(f"📊 Total commits (30 days): {total_commits}")
+    
+    # Check rate limits
+    rate_limit_url = "https://api.github.com/rate_limit"
+    rate_response = session.get(rate_limit_url, headers=headers)
+    if rate_response.status_code == 200:
+        rate_data = rate_response.json()
+        core = rate_data['resources']['core']
+        print(f"⏰ API Rate limit: {core['remaining']}/{core['limit']}")
 
 def main():
     print("🧪 GitHub Token Test")
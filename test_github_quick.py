@@ -8,13 +8,36 @@ GitHub integration is working correctly.
 Usage: python test_github_quick.py
 """
 
-import requests
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 import os
 from dotenv import load_dotenv
+from github_script_utils import cached_get, github_username
 
 load_dotenv()
 
+def fetch_commits(repo, username, since):
+    """Fetch a repository's commits by the user since the given time.
+    
+    Returns:
+        tuple: (repo, status code, list of commits or None, exception or None)
+    """
+    # Nothing pushed since the cutoff means no commits to find (ISO timestamps compare as strings)
+    if repo.get('pushed_at') and repo['pushed_at'] < since:
+        return repo, 200, [], None
+    
+    commits_url = f"https://api.github.com/repos/{repo['full_name']}/commits"
+    params = {
+        'author': username,
+        'since': since,
+        'per_page': 50
+    }
+    
+    try:
+        return (repo, *cached_get(commits_url, params=params), None)
+    except Exception as e:
+        return repo, None, None, e
+
 def test_commits():
     """Test commit fetching functionality across repositories.
     
@@ -22,65 +45,52 @@ def test_commits():
     to verify the GitHub API integration is working properly.
     """
     
-    # Extract username from environment or use default
-    github_url = os.environ.get('GITHUB_URL', '')
-    if 'github.com/' in github_url:
-        username = github_url.split('github.com/')[-1].rstrip('/')
-    else:
-        username = "your-github-username"  # Replace with your username
+    # Username from environment or use default
+    username = github_username() or "your-github-username"  # Replace with your username
     
     # Get repos
     repos_url = f"https://api.github.com/users/{username}/repos"
-    response = requests.get(repos_url, params={'type': 'owner', 'per_page': 10})
+    status, repos = cached_get(repos_url, params={'type': 'owner', 'per_page': 10})
     
-    if response.status_code != 200:
-        print(f"❌ Could not get repos: {response.status_code}")
+    if status != 200:
+        print(f"❌ Could not get repos: {status}")
         return
     
-    repos = response.json()
     print(f"📁 Found {len(repos)} repositories")
     
-    # Check commits for last 3 months
-    three_months_ago = datetime.now() - timedelta(days=90)
-    since = three_months_ago.isoformat() + 'Z'
+    # Check commits for last 3 months (from midnight, so repeat runs request the same URLs)
+    three_months_ago = datetime.now(timezone.utc) - timedelta(days=90)
+    since = three_months_ago.strftime('%Y-%m-%dT00:00:00Z')
     
     total_commits = 0
     
-    for repo in repos:
+    # Fetch every repository's commits concurrently, then report in order
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        results = list(executor.map(lambda repo: fetch_commits(repo, username, since), repos))
+    
+    for repo, status, commits, error in results:
         repo_name = repo['full_name']
         print(f"\n🔍 Checking {repo_name}...")
         
-        commits_url = f"https://api.github.com/repos/{repo_name}/commits"
-        params = {
-            'author': username,
-            'since': since,
-            'per_page': 50
-        }
-        
-        try:
-            response = requests.get(commits_url, params=params, timeout=10)
+        if error is not None:
+            print(f"   ❌ Error: {error}")
+        elif status == 200:
+            commit_count = len(commits)
+            total_commits += commit_count
+            
+            print(f"   ✅ {commit_count} commits in last 3 months")
             
-            if response.status_code == 200:
-                commits = response.json()
-                commit_count = len(commits)
-                total_commits += commit_count
-                
-                print(f"   ✅ {commit_count} commits in last 3 months")
-                
-                # Show some recent commits
-                if commits:
-                    for commit in commits[:3]:
-                        date = commit['commit']['author']['date']
-                        message = commit['commit']['message'][:50] + "..." if len(commit['commit']['message']) > 50 else commit['commit']['message']
-                        print(f"      - {date[:10]}: {message}")
-                        
-            elif response.status_code == 409:
-                print(f"   ⚠️  Empty repository")
-            else:
-                print(f"   ❌ API error: {response.status_code}")
-                
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
+            # Show some recent commits
+            if commits:
+                for commit in commits[:3]:
+                    date = commit['commit']['author']['date']
+                    message = commit['commit']['message'][:50] + "..." if len(commit['commit']['message']) > 50 else commit['commit']['message']
+                    print(f"      - {date[:10]}: {message}")
+                    
+        elif status == 409:
+            print(f"   ⚠️  Empty repository")
+        else:
+            print(f"   ❌ API error: {status}")
     
     print(f"\n📊 TOTAL: {total_commits} commits in last 3 months")
     
@@ -0,0 +1,23 @@
+"""
+Shared pytest fixtures: an app on the in-memory testing database and its client.
+"""
+
+import pytest
+
+from app import create_app, db
+
+@pytest.fixture
+def app():
+    """Create an app with the testing configuration and a fresh schema."""
+    app = create_app('testing')
+    
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+@pytest.fixture
+def client(app):
+    """Test client for the app."""
+    return app.test_client()
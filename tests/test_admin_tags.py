@@ -0,0 +1,37 @@
+"""
+Tests for creating tags from the admin area.
+"""
+
+import pytest
+
+from app import db
+from app.models import Tag
+
+@pytest.fixture
+def admin_client(app, client):
+    """A client for the admin routes, with the login checks switched off."""
+    app.config['LOGIN_DISABLED'] = True
+    return client
+
+def create_tag(client, name):
+    return client.post('/admin/tags/new', data={'name': name}, follow_redirects=True)
+
+def test_new_tag(admin_client):
+    response = create_tag(admin_client, 'Python')
+
+    assert b'Tag created successfully!' in response.data
+    assert db.session.scalar(db.select(Tag.slug).filter_by(name='Python')) == 'python'
+
+def test_duplicate_name(admin_client):
+    create_tag(admin_client, 'Python')
+    response = create_tag(admin_client, 'Python')
+
+    assert b'A tag with that name already exists.' in response.data
+
+def test_duplicate_slug(admin_client):
+    create_tag(admin_client, 'C++')
+    response = create_tag(admin_client, 'C#')
+
+    assert b'A tag with that name already exists.' not in response.data
+    assert b'already uses the URL slug' in response.data
+    assert db.session.scalar(db.select(db.func.count(Tag.id))) == 1
@@ -0,0 +1,40 @@
+"""
+Tests for the blog index search.
+"""
+
+import pytest
+
+from app import db
+from app.models import BlogPost, User
+
+@pytest.fixture
+def posts(app):
+    """Two published posts by one author."""
+    author = User(username='author', email='author@example.com')
+    author.set_password('password')
+    db.session.add(author)
+    db.session.flush()
+    
+    for title in ('Flask tips', 'Terminal tricks'):
+        post = BlogPost(title=title, content=f'All about {title.lower()}.', author_id=author.id)
+        post.publish()
+        db.session.add(post)
+    db.session.commit()
+
+@pytest.mark.parametrize('q', ['', ' ', '%20%20', '%09%0A'])
+def test_blank_search_lists_all_posts(client, posts, q):
+    response = client.get(f'/blog/?q={q}')
+    
+    assert response.status_code == 200
+    assert b'Flask tips' in response.data
+    assert b'Terminal tricks' in response.data
+
+def test_search_filters_posts(client, posts):
+    response = client.get('/blog/?q=terminal')
+    
+    assert response.status_code == 200
+    assert b'Terminal tricks' in response.data
+    assert b'Flask tips' not in response.data
+
+def test_search_filter_without_terms_matches_everything(app, posts):
+    assert BlogPost.query.filter(BlogPost.search_filter('   ')).count() == 2
@@ -0,0 +1,39 @@
+"""
+Tests for saving portfolio image uploads.
+"""
+
+import io
+import os
+
+import pytest
+from PIL import Image
+from werkzeug.datastructures import FileStorage
+
+from app.image_utils import save_portfolio_image
+
+@pytest.fixture
+def upload_dir(app, tmp_path, monkeypatch):
+    """Point the app's static files at a temporary directory."""
+    monkeypatch.setattr(app, 'root_path', str(tmp_path))
+    return tmp_path / 'static' / 'images' / 'portfolio'
+
+def png_upload(size):
+    data = io.BytesIO()
+    Image.new('RGBA', size, (255, 0, 0, 128)).save(data, 'PNG')
+    data.seek(0)
+    return FileStorage(stream=data, filename='screenshot.png')
+
+def test_upload_is_resized_before_returning(upload_dir):
+    success, filename, error = save_portfolio_image(png_upload((2400, 1600)))
+
+    assert success and error is None
+    assert os.listdir(upload_dir) == [filename]
+    with Image.open(upload_dir / filename) as img:
+        assert img.format == 'JPEG'
+        assert img.size == (1200, 800)
+
+def test_invalid_image_is_rejected(upload_dir):
+    upload = FileStorage(stream=io.BytesIO(b'not an image'), filename='fake.png')
+
+    assert save_portfolio_image(upload) == (False, None, 'Invalid image file')
+    assert not upload_dir.exists() or not os.listdir(upload_dir)
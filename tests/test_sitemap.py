@@ -0,0 +1,75 @@
+"""
+Tests for the sitemap's ETag and conditional responses.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app import db, models
+from app.models import BlogPost, User, flush_pending_views
+
+@pytest.fixture
+def posts(app):
+    """Three posts, the first two published, with fixed edit times."""
+    models._pending_views.clear()
+
+    author = User(username='author', email='author@example.com')
+    author.set_password('password')
+    db.session.add(author)
+    db.session.flush()
+
+    posts = []
+    for title in ('First post', 'Second post', 'Draft post'):
+        post = BlogPost(title=title, content='Some content.', author_id=author.id)
+        post.generate_slug()
+        db.session.add(post)
+        db.session.flush()
+        posts.append(post)
+    posts[0].publish()
+    posts[1].publish()
+    set_edit_times(posts)
+    db.session.commit()
+
+    yield posts
+    models._pending_views.clear()
+
+def set_edit_times(posts):
+    """Pin the edit times, the first post's being the latest."""
+    for day, post in zip((3, 1, 2), posts):
+        post.updated_at = datetime(2024, 1, day)
+
+def sitemap_etag(client):
+    response = client.get('/sitemap.xml')
+    assert response.status_code == 200
+    return response.get_etag()[0]
+
+def test_unchanged_sitemap_is_not_modified(client, posts):
+    etag = sitemap_etag(client)
+
+    response = client.get('/sitemap.xml', headers={'If-None-Match': f'"{etag}"'})
+
+    assert response.status_code == 304
+
+def test_views_do_not_change_etag(client, posts):
+    etag = sitemap_etag(client)
+
+    client.get(f'/blog/post/{posts[0].slug}')
+    flush_pending_views()
+
+    response = client.get('/sitemap.xml', headers={'If-None-Match': f'"{etag}"'})
+    assert response.status_code == 304
+
+def test_publishing_changes_etag(client, posts):
+    etag = sitemap_etag(client)
+
+    # Swap which post is published: the count and the latest edit stay the same
+    posts[1].unpublish()
+    posts[2].publish()
+    set_edit_times(posts)
+    db.session.commit()
+
+    response = client.get('/sitemap.xml', headers={'If-None-Match': f'"{etag}"'})
+    assert response.status_code == 200
+    assert posts[2].slug.encode() in response.data
+    assert posts[1].slug.encode() not in response.data
@@ -0,0 +1,26 @@
+"""
+Tests for the terminal API's precomputed responses.
+"""
+
+from app import create_app
+from app.config import TestingConfig, config
+
+class OtherLinksConfig(TestingConfig):
+    GITHUB_URL = 'https://github.com/someone-else'
+
+def test_unknown_command(client):
+    response = client.get('/api/terminal/command/nope')
+
+    assert response.status_code == 200
+    assert response.get_json()['output'][0] == 'Command not found: nope'
+
+def test_responses_are_built_per_app(app, monkeypatch):
+    monkeypatch.setitem(config, 'other_links', OtherLinksConfig)
+    other_app = create_app('other_links')
+
+    first = app.test_client().get('/api/terminal/command/contact').get_json()
+    second = other_app.test_client().get('/api/terminal/command/contact').get_json()
+
+    assert '🐙 GitHub: ' + app.config['GITHUB_URL'] in first['output']
+    assert '🐙 GitHub: https://github.com/someone-else' in second['output']
+    assert first != second
@@ -0,0 +1,74 @@
+"""
+Tests for buffered blog post view counting.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app import db, models
+from app.models import BlogPost, User, flush_pending_views
+
+@pytest.fixture
+def post(app):
+    """A published post, with the view buffer emptied around the test."""
+    models._pending_views.clear()
+    
+    author = User(username='author', email='author@example.com')
+    author.set_password('password')
+    db.session.add(author)
+    db.session.flush()
+    
+    post = BlogPost(title='Counting views', content='Some content.', author_id=author.id)
+    post.publish()
+    db.session.add(post)
+    db.session.commit()
+    
+    yield post
+    models._pending_views.clear()
+
+def stored_view_count(post_id):
+    db.session.expire_all()
+    return db.session.get(BlogPost, post_id).view_count
+
+def test_views_are_written_on_flush(client, post):
+    for _ in range(3):
+        assert client.get(f'/blog/post/{post.slug}').status_code == 200
+    
+    flush_pending_views()
+    
+    assert stored_view_count(post.id) == 3
+    assert not models._pending_views
+
+def test_flush_leaves_updated_at_alone(post):
+    last_edit = datetime(2020, 1, 1, 12, 0)
+    post.updated_at = last_edit
+    db.session.commit()
+    
+    post.increment_views()
+    flush_pending_views()
+    
+    db.session.expire_all()
+    assert db.session.get(BlogPost, post.id).updated_at == last_edit
+
+def test_failed_flush_keeps_views_for_next_flush(app, post, monkeypatch):
+    post.increment_views()
+    post.increment_views()
+    
+    class LockedEngine:
+        def begin(self):
+            raise OperationalError('UPDATE blog_posts', {}, Exception('database is locked'))
+    
+    class LockedDb:
+        engine = LockedEngine()
+    
+    with monkeypatch.context() as m:
+        m.setattr(models, 'db', LockedDb())
+        flush_pending_views()
+    
+    assert models._pending_views[post.id] == 2
+    
+    flush_pending_views()
+    
+    assert stored_view_count(post.id) == 2